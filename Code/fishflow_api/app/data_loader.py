@@ -6,11 +6,45 @@ or S3 buckets, depending on the FISHFLOW_DATA_DIR configuration.
 
 import os
 import json
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import pandas as pd
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 import boto3
-from io import BytesIO
+import ijson
+from botocore.config import Config
+
+
+# Retry and timeout settings shared by the boto3 client (JSON reads) and the
+# pyarrow filesystems (parquet reads), so both behave the same against S3.
+S3_MAX_ATTEMPTS = 3
+S3_CONNECT_TIMEOUT = 60.0
+S3_READ_TIMEOUT = 60.0
+
+# Connection settings for the shared S3 client. The default pool of 10
+# connections is exhausted quickly under concurrent requests.
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'standard', 'max_attempts': S3_MAX_ATTEMPTS},
+    connect_timeout=S3_CONNECT_TIMEOUT,
+    read_timeout=S3_READ_TIMEOUT,
+    tcp_keepalive=True,
+    s3={'addressing_style': 'virtual'}
+)
+
+
+def get_s3_endpoint_url() -> Optional[str]:
+    """Get the S3 endpoint override, if any.
+
+    Uses the same environment variables boto3 reads (AWS_ENDPOINT_URL_S3,
+    then AWS_ENDPOINT_URL), e.g. to point at a local S3 compatible store.
+
+    Returns:
+        Endpoint URL, or None to use AWS's own S3 endpoints
+    """
+    return os.getenv("AWS_ENDPOINT_URL_S3") or os.getenv("AWS_ENDPOINT_URL")
 
 
 def is_s3_path(path: str) -> bool:
@@ -25,6 +59,53 @@ def is_s3_path(path: str) -> bool:
     return path.startswith("s3://")
 
 
+@lru_cache(maxsize=None)
+def get_s3_client():
+    """Get the S3 client shared by all data loading functions.
+
+    The client is created once per process so that its connection pool is
+    reused across requests.
+
+    Returns:
+        boto3 S3 client configured with S3_CLIENT_CONFIG
+    """
+    return boto3.client(
+        's3', config=S3_CLIENT_CONFIG, endpoint_url=get_s3_endpoint_url()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_s3_filesystem(bucket: str) -> pafs.S3FileSystem:
+    """Get the pyarrow S3 filesystem used for reading parquet from a bucket.
+
+    pyarrow issues ranged GETs itself, so parquet reads only fetch the footer
+    and the column chunks that are requested. One filesystem is created per
+    bucket, in that bucket's region, with the same endpoint, retries and
+    timeouts as the shared S3 client.
+
+    Args:
+        bucket: Name of the S3 bucket
+
+    Returns:
+        pyarrow S3FileSystem for the bucket's region
+    """
+    endpoint_url = get_s3_endpoint_url()
+    if endpoint_url:
+        # Custom endpoints don't answer AWS's region lookup; use the region
+        # the shared client is configured with
+        region = get_s3_client().meta.region_name
+    else:
+        region = pafs.resolve_s3_region(bucket)
+
+    return pafs.S3FileSystem(
+        region=region,
+        endpoint_override=endpoint_url,
+        retry_strategy=pafs.AwsStandardS3RetryStrategy(max_attempts=S3_MAX_ATTEMPTS),
+        connect_timeout=S3_CONNECT_TIMEOUT,
+        request_timeout=S3_READ_TIMEOUT
+    )
+
+
 def parse_s3_path(s3_path: str) -> tuple[str, str]:
     """Parse S3 path into bucket and key.
 
@@ -67,7 +148,7 @@ def read_json_file(base_path: str, relative_path: str) -> Dict[str, Any]:
         bucket, key_prefix = parse_s3_path(base_path)
         full_key = f"{key_prefix}/{relative_path}" if key_prefix else relative_path
 
-        s3_client = boto3.client('s3')
+        s3_client = get_s3_client()
         try:
             response = s3_client.get_object(Bucket=bucket, Key=full_key)
             content = response['Body'].read().decode('utf-8')
@@ -89,6 +170,134 @@ def read_json_file(base_path: str, relative_path: str) -> Dict[str, Any]:
             raise ValueError(f"Invalid JSON in {full_path}: {e}")
 
 
+def read_file_bytes(base_path: str, relative_path: str) -> bytes:
+    """Read the raw contents of a file from local or S3 storage.
+
+    Args:
+        base_path: Base directory path (local or S3)
+        relative_path: Relative path to the file
+
+    Returns:
+        File contents as bytes
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        Exception: For S3-related errors
+    """
+    if is_s3_path(base_path):
+        bucket, key_prefix = parse_s3_path(base_path)
+        full_key = f"{key_prefix}/{relative_path}" if key_prefix else relative_path
+
+        s3_client = get_s3_client()
+        try:
+            response = s3_client.get_object(Bucket=bucket, Key=full_key)
+            return response['Body'].read()
+        except s3_client.exceptions.NoSuchKey:
+            raise FileNotFoundError(f"File not found: s3://{bucket}/{full_key}")
+    else:
+        # Local file system
+        full_path = Path(base_path) / relative_path
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {full_path}")
+
+        return full_path.read_bytes()
+
+
+def get_file_version(base_path: str, relative_path: str) -> str:
+    """Get a token that changes whenever a file is rewritten.
+
+    This is the object's ETag for S3 (a HEAD request, the body is not read)
+    and the modification time and size for local files.
+
+    Args:
+        base_path: Base directory path (local or S3)
+        relative_path: Relative path to the file
+
+    Returns:
+        Version token for the current contents of the file
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        Exception: For S3-related errors
+    """
+    if is_s3_path(base_path):
+        bucket, key_prefix = parse_s3_path(base_path)
+        full_key = f"{key_prefix}/{relative_path}" if key_prefix else relative_path
+
+        s3_client = get_s3_client()
+        try:
+            response = s3_client.head_object(Bucket=bucket, Key=full_key)
+        except s3_client.exceptions.ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File not found: s3://{bucket}/{full_key}")
+            raise
+        return response['ETag']
+    else:
+        # Local file system
+        full_path = Path(base_path) / relative_path
+        try:
+            stat = full_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {full_path}")
+
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def read_json_streaming(
+    base_path: str,
+    relative_path: str,
+    item_prefix: str = ""
+) -> Iterator[Tuple[str, Any]]:
+    """Stream the key/value pairs of a JSON object from local or S3 storage.
+
+    Unlike read_json_file the document is never held in memory in full; each
+    top level entry is parsed and yielded as soon as its bytes have been read.
+    For S3 the response body is consumed as a stream rather than read upfront.
+
+    Args:
+        base_path: Base directory path (local or S3)
+        relative_path: Relative path to the JSON file
+        item_prefix: ijson prefix of the object whose entries should be
+            yielded ('' for the top level object)
+
+    Yields:
+        Tuples of (key, parsed_value) for each entry of the object
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If JSON is invalid
+        Exception: For S3-related errors
+    """
+    if is_s3_path(base_path):
+        bucket, key_prefix = parse_s3_path(base_path)
+        full_key = f"{key_prefix}/{relative_path}" if key_prefix else relative_path
+
+        s3_client = get_s3_client()
+        try:
+            response = s3_client.get_object(Bucket=bucket, Key=full_key)
+        except s3_client.exceptions.NoSuchKey:
+            raise FileNotFoundError(f"File not found: s3://{bucket}/{full_key}")
+
+        body = response['Body']
+        try:
+            yield from ijson.kvitems(body, item_prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in s3://{bucket}/{full_key}: {e}")
+        finally:
+            body.close()
+    else:
+        # Local file system
+        full_path = Path(base_path) / relative_path
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {full_path}")
+
+        try:
+            with open(full_path, 'rb') as f:
+                yield from ijson.kvitems(f, item_prefix, use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {full_path}: {e}")
+
+
 def read_geojson_file(base_path: str, relative_path: str) -> Dict[str, Any]:
     """Read GeoJSON file from local or S3 storage.
 
@@ -104,38 +313,75 @@ def read_geojson_file(base_path: str, relative_path: str) -> Dict[str, Any]:
     return read_json_file(base_path, relative_path)
 
 
-def read_parquet_file(base_path: str, relative_path: str) -> pd.DataFrame:
+def _read_parquet(source: Any, columns: Optional[List[str]], location: str) -> pd.DataFrame:
+    """Read (a projection of) a parquet file into a DataFrame.
+
+    Args:
+        source: Local path or open pyarrow file
+        columns: Names of the columns to read, or None for all columns
+        location: Human readable location of the file for error messages
+
+    Returns:
+        DataFrame containing the requested columns
+
+    Raises:
+        KeyError: If any requested column is not in the file
+    """
+    parquet_file = pq.ParquetFile(source, pre_buffer=True)
+
+    if columns is not None:
+        missing = set(columns) - set(parquet_file.schema_arrow.names)
+        if missing:
+            raise KeyError(f"Columns {sorted(missing)} not found in {location}")
+
+    return parquet_file.read(columns=columns).to_pandas()
+
+
+def read_parquet_file(
+    base_path: str,
+    relative_path: str,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
     """Read Parquet file from local or S3 storage.
 
+    When columns are given only those column chunks are read (for S3 they are
+    fetched with coalesced ranged requests rather than downloading the file).
+
     Args:
         base_path: Base directory path (local or S3)
         relative_path: Relative path to the Parquet file
+        columns: Optional names of the columns to read (defaults to all)
 
     Returns:
         DataFrame containing the parquet data
 
     Raises:
         FileNotFoundError: If file doesn't exist
+        KeyError: If any requested column is not in the file
         Exception: For S3-related or parquet reading errors
     """
     if is_s3_path(base_path):
         bucket, key_prefix = parse_s3_path(base_path)
         full_key = f"{key_prefix}/{relative_path}" if key_prefix else relative_path
+        location = f"s3://{bucket}/{full_key}"
 
-        s3_client = boto3.client('s3')
+        # Opening the file already checks that it exists (and gets its size),
+        # so there is no separate existence check
+        s3_filesystem = get_s3_filesystem(bucket)
         try:
-            response = s3_client.get_object(Bucket=bucket, Key=full_key)
-            content = response['Body'].read()
-            return pd.read_parquet(BytesIO(content))
-        except s3_client.exceptions.NoSuchKey:
-            raise FileNotFoundError(f"File not found: s3://{bucket}/{full_key}")
+            f = s3_filesystem.open_input_file(f"{bucket}/{full_key}")
+        except OSError:
+            raise FileNotFoundError(f"File not found: {location}")
+
+        with f:
+            return _read_parquet(f, columns, location)
     else:
         # Local file system
         full_path = Path(base_path) / relative_path
         if not full_path.exists():
             raise FileNotFoundError(f"File not found: {full_path}")
 
-        return pd.read_parquet(full_path)
+        return _read_parquet(str(full_path), columns, str(full_path))
 
 
 def list_directories(base_path: str, relative_path: str = "") -> List[str]:
@@ -157,7 +403,7 @@ def list_directories(base_path: str, relative_path: str = "") -> List[str]:
         if full_prefix and not full_prefix.endswith('/'):
             full_prefix += '/'
 
-        s3_client = boto3.client('s3')
+        s3_client = get_s3_client()
         paginator = s3_client.get_paginator('list_objects_v2')
 
         # Use delimiter to get only immediate subdirectories
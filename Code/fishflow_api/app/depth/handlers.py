@@ -5,19 +5,22 @@ including data retrieval and transformation from the report files.
 """
 
 import os
-from typing import List
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 from fastapi import HTTPException
 from app.depth.models import (
     Scenario,
     Scenarios,
     Geometries,
-    CellDepths,
-    Timestamps,
     Minimums,
     Occupancy
 )
 from app.data_loader import (
+    get_file_version,
     read_json_file,
+    read_json_streaming,
+    read_file_bytes,
     read_geojson_file,
     read_parquet_file,
     list_directories
@@ -42,6 +45,73 @@ def get_data_dir() -> str:
     return data_dir
 
 
+# How often (in seconds) load_meta_data re-checks the version of a cached
+# meta_data.json. On S3 each check is a HEAD request.
+META_DATA_CHECK_INTERVAL = 60.0
+
+# (data_dir, meta_path) -> (time of the last check, version found then)
+_meta_data_versions: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+def load_meta_data(data_dir: str, scenario_id: str) -> Tuple[Dict[str, Any], Dict[float, int]]:
+    """Load scenario metadata together with a depth_bin to index lookup.
+
+    Metadata only changes when a report is regenerated, so results are cached
+    per version of meta_data.json (see get_file_version). The version itself
+    is only re-checked every META_DATA_CHECK_INTERVAL seconds, so a report
+    that is regenerated in place is picked up within that interval. The
+    returned objects are shared between requests and must not be modified.
+
+    Args:
+        data_dir: Data directory path (local or S3)
+        scenario_id: Unique identifier for the scenario
+
+    Returns:
+        Tuple of (meta_data, depth_bin_to_idx) where depth_bin_to_idx maps each
+        value in meta_data['depth_bins'] to its position
+
+    Raises:
+        FileNotFoundError: If the metadata file doesn't exist
+        ValueError: If the metadata is invalid JSON
+    """
+    meta_path = f"depth/{scenario_id}/meta_data.json"
+
+    now = time.monotonic()
+    checked = _meta_data_versions.get((data_dir, meta_path))
+    if checked is None or now - checked[0] >= META_DATA_CHECK_INTERVAL:
+        version = get_file_version(data_dir, meta_path)
+        _meta_data_versions[(data_dir, meta_path)] = (now, version)
+    else:
+        version = checked[1]
+
+    return _load_meta_data(data_dir, meta_path, version)
+
+
+@lru_cache(maxsize=128)
+def _load_meta_data(
+    data_dir: str,
+    meta_path: str,
+    version: str
+) -> Tuple[Dict[str, Any], Dict[float, int]]:
+    """Read and index one version of a metadata file (see load_meta_data).
+
+    Args:
+        data_dir: Data directory path (local or S3)
+        meta_path: Relative path to the meta_data.json file
+        version: Version of the file, only used as part of the cache key
+
+    Returns:
+        Tuple of (meta_data, depth_bin_to_idx)
+    """
+    meta_data = read_json_file(data_dir, meta_path)
+
+    depth_bin_to_idx = {
+        depth_bin: idx for idx, depth_bin in enumerate(meta_data.get("depth_bins", []))
+    }
+
+    return meta_data, depth_bin_to_idx
+
+
 def get_scenarios() -> Scenarios:
     """Get all available scenarios.
 
@@ -166,7 +236,9 @@ def get_geometries(scenario_id: str) -> Geometries:
             'features': geojson_data['features']
         }
 
-        return Geometries(clean_geojson)
+        # Skip validation: walking every feature's geometry is costly for
+        # large grids and the top level structure was checked above
+        return Geometries.model_construct(clean_geojson)
 
     except FileNotFoundError:
         raise HTTPException(
@@ -185,14 +257,18 @@ def get_geometries(scenario_id: str) -> Geometries:
         )
 
 
-def get_cell_depths(scenario_id: str) -> CellDepths:
+def get_cell_depths(scenario_id: str) -> bytes:
     """Get cell depths mapping for a specific scenario.
 
+    JSON object keys are always strings, so converting the cell ids to int
+    only for them to be written back out as strings is skipped and the file
+    is passed through as-is.
+
     Args:
         scenario_id: Unique identifier for the scenario
 
     Returns:
-        CellDepths model with cell_id to max depth mapping (unwrapped dict)
+        Raw JSON bytes of the cell_id to max depth mapping (unwrapped dict)
 
     Raises:
         HTTPException: If scenario not found or data is corrupt
@@ -201,12 +277,13 @@ def get_cell_depths(scenario_id: str) -> CellDepths:
         data_dir = get_data_dir()
         cell_depths_path = f"depth/{scenario_id}/cell_depths.json"
 
-        cell_depths_data = read_json_file(data_dir, cell_depths_path)
+        cell_depths_data = read_file_bytes(data_dir, cell_depths_path)
 
-        # Convert string keys to integers
-        cell_depths_int = {int(k): v for k, v in cell_depths_data.items()}
+        stripped = cell_depths_data.strip()
+        if not (stripped.startswith(b"{") and stripped.endswith(b"}")):
+            raise ValueError("Cell depths data must be a mapping")
 
-        return CellDepths(cell_depths_int)
+        return cell_depths_data
 
     except FileNotFoundError:
         raise HTTPException(
@@ -225,14 +302,18 @@ def get_cell_depths(scenario_id: str) -> CellDepths:
         )
 
 
-def get_timestamps(scenario_id: str) -> Timestamps:
+def get_timestamps(scenario_id: str) -> bytes:
     """Get timestamps array for a specific scenario.
 
+    The report already writes timestamps.json as the unwrapped array the
+    endpoint returns, so the file is passed through as-is rather than parsed
+    into one Python string per timestamp and re-encoded.
+
     Args:
         scenario_id: Unique identifier for the scenario
 
     Returns:
-        Timestamps model with ordered list of timestamps (unwrapped array)
+        Raw JSON bytes of the ordered list of timestamps (unwrapped array)
 
     Raises:
         HTTPException: If scenario not found or data is corrupt
@@ -241,12 +322,13 @@ def get_timestamps(scenario_id: str) -> Timestamps:
         data_dir = get_data_dir()
         timestamps_path = f"depth/{scenario_id}/timestamps.json"
 
-        timestamps_data = read_json_file(data_dir, timestamps_path)
+        timestamps_data = read_file_bytes(data_dir, timestamps_path)
 
-        if not isinstance(timestamps_data, list):
+        stripped = timestamps_data.strip()
+        if not (stripped.startswith(b"[") and stripped.endswith(b"]")):
             raise ValueError("Timestamps data must be a list")
 
-        return Timestamps(timestamps_data)
+        return timestamps_data
 
     except FileNotFoundError:
         raise HTTPException(
@@ -281,11 +363,10 @@ def get_minimums(scenario_id: str) -> Minimums:
         data_dir = get_data_dir()
         minimums_path = f"depth/{scenario_id}/minimums.json"
 
-        minimums_data = read_json_file(data_dir, minimums_path)
-
-        # Convert string keys to appropriate types
+        # Stream the file cell by cell so the raw document is never held
+        # in memory alongside the converted one
         minimums_converted = {}
-        for cell_id_str, depth_bins in minimums_data.items():
+        for cell_id_str, depth_bins in read_json_streaming(data_dir, minimums_path):
             cell_id = int(cell_id_str)
             minimums_converted[cell_id] = {}
 
@@ -297,7 +378,8 @@ def get_minimums(scenario_id: str) -> Minimums:
                     month = int(month_str)
                     minimums_converted[cell_id][depth_bin][month] = hourly_data
 
-        return Minimums(minimums_converted)
+        # Built from the report's own output, so skip re-validating every leaf
+        return Minimums.model_construct(minimums_converted)
 
     except FileNotFoundError:
         raise HTTPException(
@@ -334,42 +416,41 @@ def get_occupancy(scenario_id: str, cell_id: int, depth_bin: float) -> Occupancy
         data_dir = get_data_dir()
 
         # First, get metadata to find depth_bin index and number of models
-        meta_path = f"depth/{scenario_id}/meta_data.json"
-        meta_data = read_json_file(data_dir, meta_path)
+        meta_data, depth_bin_to_idx = load_meta_data(data_dir, scenario_id)
 
         depth_bins = meta_data.get("depth_bins", [])
         support = meta_data.get("support", [])
 
-        if depth_bin not in depth_bins:
+        depth_bin_idx = depth_bin_to_idx.get(depth_bin)
+        if depth_bin_idx is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid depth_bin: {depth_bin}. Valid bins: {depth_bins}"
             )
 
-        depth_bin_idx = depth_bins.index(depth_bin)
         num_depth_bins = len(depth_bins)
         num_models = len(support)
 
-        # Read the parquet file for this cell
-        occupancy_path = f"depth/{scenario_id}/{cell_id}_occupancy.parquet.gz"
-        df = read_parquet_file(data_dir, occupancy_path)
-
-        # Extract timelines for each model at the specified depth bin
+        # Only read the columns for this depth bin, one per model
         # Column index formula: model_idx * num_depth_bins + depth_bin_idx
-        timelines = []
-        for model_idx in range(num_models):
-            col_idx = model_idx * num_depth_bins + depth_bin_idx
-            if col_idx >= len(df.columns):
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Column index {col_idx} out of range in occupancy data"
-                )
-
-            # Extract the column and convert to list, handling null values
-            timeline = df.iloc[:, col_idx].tolist()
-            timelines.append(timeline)
-
-        return Occupancy(timelines)
+        columns = [
+            str(model_idx * num_depth_bins + depth_bin_idx)
+            for model_idx in range(num_models)
+        ]
+
+        occupancy_path = f"depth/{scenario_id}/{cell_id}_occupancy.parquet"
+        try:
+            df = read_parquet_file(data_dir, occupancy_path, columns=columns)
+        except KeyError as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Corrupt occupancy data for scenario '{scenario_id}', cell {cell_id}: {str(e)}"
+            )
+
+        # Extract the columns (in model order) and convert to lists, handling null values
+        timelines = [df.iloc[:, model_idx].tolist() for model_idx in range(num_models)]
+
+        return Occupancy.model_construct(timelines)
 
     except FileNotFoundError:
         raise HTTPException(
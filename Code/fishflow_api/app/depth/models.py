@@ -4,7 +4,7 @@ This module defines the response models for all depth-related API endpoints,
 corresponding to the schemas defined in the design documentation.
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel, Field, RootModel
 from datetime import datetime
 
@@ -67,16 +67,17 @@ class Timestamps(RootModel[List[str]]):
     root: List[str] = Field(..., description="Ordered list of timestamps")
 
 
-class Minimums(RootModel[Dict[int, Dict[float, Dict[int, List[float]]]]]):
+class Minimums(RootModel[Dict[int, Dict[float, Dict[int, List[Optional[float]]]]]]):
     """Model for minimum depth occupancy data.
 
     Corresponds to MinimumsSchema - nested structure of cell_id -> depth_bin -> month -> hourly minimums.
     Returns the nested dict directly without wrapping: {cell_id(int) -> {depth_bin -> {month(int) -> minimums_array}}}
-    where minimums_array is an array of length 24 containing floats (minimum depth occupancy per hour 0-23).
+    where minimums_array is an array of length 24 containing floats (minimum depth occupancy per hour 0-23),
+    or null for hours without data.
     """
-    root: Dict[int, Dict[float, Dict[int, List[float]]]] = Field(
+    root: Dict[int, Dict[float, Dict[int, List[Optional[float]]]]] = Field(
         ...,
-        description="Nested mapping: cell_id -> depth_bin -> month -> array[24] of hourly minimums"
+        description="Nested mapping: cell_id -> depth_bin -> month -> array[24] of hourly minimums (null without data)"
     )
 
 
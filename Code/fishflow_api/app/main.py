@@ -4,7 +4,10 @@ This module sets up the FastAPI application and registers all endpoints.
 """
 
 import os
-from fastapi import FastAPI, Query
+import hashlib
+from typing import Any
+import orjson
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.depth.models import (
@@ -50,6 +53,77 @@ app.add_middleware(
 )
 
 
+# Scenario artifacts only change when a report is regenerated, so clients
+# and CDNs may reuse them without revalidating for an hour
+CACHE_CONTROL = "public, max-age=3600, immutable"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an ETag.
+
+    Args:
+        if_none_match: Value of the If-None-Match request header
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        True if the header is '*' or lists the ETag (weak or strong)
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def json_response(content: Any) -> Response:
+    """Serialize content as JSON without a pydantic validation pass.
+
+    Args:
+        content: JSON serializable content (non-string dict keys allowed)
+
+    Returns:
+        Response with the serialized content
+    """
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return Response(content=body, media_type="application/json")
+
+
+def cached_response(request: Request, body: bytes) -> Response:
+    """Wrap a serialized JSON body with ETag and Cache-Control headers.
+
+    Returns 304 Not Modified with an empty body when the request's
+    If-None-Match header already matches the body.
+
+    Args:
+        request: The incoming request
+        body: Serialized JSON body
+
+    Returns:
+        Response with the body, or an empty 304 response
+    """
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_json_response(request: Request, content: Any) -> Response:
+    """Serialize content as JSON with ETag and Cache-Control headers.
+
+    Args:
+        request: The incoming request
+        content: JSON serializable content (non-string dict keys allowed)
+
+    Returns:
+        Response with the serialized content, or an empty 304 response
+    """
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return cached_response(request, body)
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint.
@@ -74,7 +148,7 @@ async def list_scenarios():
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/scenario", response_model=Scenario, tags=["Depth"])
-async def get_scenario_metadata(scenario_id: str):
+async def get_scenario_metadata(scenario_id: str, request: Request):
     """Get metadata for a specific scenario.
 
     Args:
@@ -83,11 +157,11 @@ async def get_scenario_metadata(scenario_id: str):
     Returns:
         Scenario: Metadata for the requested scenario
     """
-    return get_scenario(scenario_id)
+    return cached_json_response(request, get_scenario(scenario_id).model_dump())
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/geometries", response_model=Geometries, tags=["Depth"])
-async def get_scenario_geometries(scenario_id: str):
+async def get_scenario_geometries(scenario_id: str, request: Request):
     """Get geometries (GeoJSON) for a specific scenario.
 
     Args:
@@ -96,11 +170,13 @@ async def get_scenario_geometries(scenario_id: str):
     Returns:
         Geometries: GeoJSON FeatureCollection with cell geometries
     """
-    return get_geometries(scenario_id)
+    # Returned as a response directly so FastAPI does not re-validate the
+    # features against the response model
+    return cached_json_response(request, get_geometries(scenario_id).root)
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/cell_depths", response_model=CellDepths, tags=["Depth"])
-async def get_scenario_cell_depths(scenario_id: str):
+async def get_scenario_cell_depths(scenario_id: str, request: Request):
     """Get cell depths mapping for a specific scenario.
 
     Args:
@@ -109,11 +185,11 @@ async def get_scenario_cell_depths(scenario_id: str):
     Returns:
         CellDepths: Mapping of cell_id to maximum depth bin
     """
-    return get_cell_depths(scenario_id)
+    return cached_response(request, get_cell_depths(scenario_id))
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/timestamps", response_model=Timestamps, tags=["Depth"])
-async def get_scenario_timestamps(scenario_id: str):
+async def get_scenario_timestamps(scenario_id: str, request: Request):
     """Get timestamps array for a specific scenario.
 
     Args:
@@ -122,7 +198,7 @@ async def get_scenario_timestamps(scenario_id: str):
     Returns:
         Timestamps: Ordered list of all timestamps in the report
     """
-    return get_timestamps(scenario_id)
+    return cached_response(request, get_timestamps(scenario_id))
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/minimums", response_model=Minimums, tags=["Depth"])
@@ -135,7 +211,7 @@ async def get_scenario_minimums(scenario_id: str):
     Returns:
         Minimums: Nested structure of minimum occupancy by cell, depth, month, and hour
     """
-    return get_minimums(scenario_id)
+    return json_response(get_minimums(scenario_id).root)
 
 
 @app.get("/v1/depth/scenario/{scenario_id}/occupancy", response_model=Occupancy, tags=["Depth"])
@@ -154,7 +230,7 @@ async def get_scenario_occupancy(
     Returns:
         Occupancy: Array of timelines, one per model, for the specified cell and depth bin
     """
-    return get_occupancy(scenario_id, cell_id, depth_bin)
+    return json_response(get_occupancy(scenario_id, cell_id, depth_bin).root)
 
 
 if __name__ == "__main__":
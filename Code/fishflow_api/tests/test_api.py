@@ -1,18 +1,27 @@
 """Integration tests for FishFlow API endpoints."""
 
-import pytest
-import json
+import io
 import os
+import pytest
+import orjson
 from pathlib import Path
 from fastapi.testclient import TestClient
-import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from app.main import app
+from app import data_loader
+from app.depth import handlers
+from app.depth.handlers import load_meta_data
 
 
-@pytest.fixture
-def test_data_dir(tmp_path):
-    """Create a complete test data directory structure."""
+@pytest.fixture(scope="session")
+def test_data_dir(tmp_path_factory):
+    """Create a complete test data directory structure.
+
+    Built once per session since the endpoints only ever read it.
+    """
+    tmp_path = tmp_path_factory.mktemp("fishflow")
     depth_dir = tmp_path / "depth"
     depth_dir.mkdir()
 
@@ -39,8 +48,7 @@ def test_data_dir(tmp_path):
         "zoom": 8,
         "center": [-122.4194, 37.7749]
     }
-    with open(scenario_dir / "meta_data.json", 'w') as f:
-        json.dump(metadata, f)
+    (scenario_dir / "meta_data.json").write_bytes(orjson.dumps(metadata))
 
     # Create geometries (simple GeoJSON)
     geometries = {
@@ -64,16 +72,14 @@ def test_data_dir(tmp_path):
             }
         ]
     }
-    with open(scenario_dir / "geometries.geojson", 'w') as f:
-        json.dump(geometries, f)
+    (scenario_dir / "geometries.geojson").write_bytes(orjson.dumps(geometries))
 
     # Create cell_depths
     cell_depths = {
         "1": 30.0,
         "2": 20.0
     }
-    with open(scenario_dir / "cell_depths.json", 'w') as f:
-        json.dump(cell_depths, f)
+    (scenario_dir / "cell_depths.json").write_bytes(orjson.dumps(cell_depths))
 
     # Create timestamps
     timestamps = [
@@ -81,8 +87,7 @@ def test_data_dir(tmp_path):
         "2024-01-01 01:00:00",
         "2024-01-01 02:00:00"
     ]
-    with open(scenario_dir / "timestamps.json", 'w') as f:
-        json.dump(timestamps, f)
+    (scenario_dir / "timestamps.json").write_bytes(orjson.dumps(timestamps))
 
     # Create minimums
     minimums = {
@@ -94,42 +99,59 @@ def test_data_dir(tmp_path):
         },
         "2": {
             "10.0": {
-                "1": [0.15] * 24
+                "1": [0.15] * 23 + [None]
             }
         }
     }
-    with open(scenario_dir / "minimums.json", 'w') as f:
-        json.dump(minimums, f)
+    (scenario_dir / "minimums.json").write_bytes(orjson.dumps(minimums))
 
-    # Create occupancy parquet file for cell 1
-    # 3 timestamps x (3 models x 4 depth_bins) = 3 rows x 12 columns
+    # Create occupancy parquet files for cells 1 and 2
+    # 3 timestamps x (3 models x 4 depth_bins) = 3 rows x 12 columns per cell
     num_timestamps = 3
     num_models = 3
     num_depth_bins = 4
-    data = np.random.rand(num_timestamps, num_models * num_depth_bins)
-    df = pd.DataFrame(data)
-    df.to_parquet(scenario_dir / "1_occupancy.parquet.gz", compression='gzip')
-
-    # Create occupancy parquet file for cell 2
-    df2 = pd.DataFrame(np.random.rand(num_timestamps, num_models * num_depth_bins))
-    df2.to_parquet(scenario_dir / "2_occupancy.parquet.gz", compression='gzip')
+    rng = np.random.default_rng(0)
+    data = rng.random((2, num_timestamps, num_models * num_depth_bins))
+    column_names = [str(col) for col in range(num_models * num_depth_bins)]
+    for cell_idx, cell_id in enumerate((1, 2)):
+        table = pa.Table.from_arrays(
+            [pa.array(column) for column in data[cell_idx].T], names=column_names
+        )
+        pq.write_table(table, scenario_dir / f"{cell_id}_occupancy.parquet", compression=None)
 
     return tmp_path
 
 
+@pytest.fixture(scope="session")
+def monkeypatch_session():
+    """Session scoped equivalent of the monkeypatch fixture."""
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
+
+
+@pytest.fixture(scope="session")
+def client(test_data_dir, monkeypatch_session):
+    """Create a test client with the test data directory.
+
+    The client (and the app's startup) is shared by every test.
+    """
+    monkeypatch_session.setenv("FISHFLOW_DATA_DIR", str(test_data_dir))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(test_data_dir):
-    """Create a test client with the test data directory."""
-    os.environ["FISHFLOW_DATA_DIR"] = str(test_data_dir)
+def client_bare():
+    """Create a test client without setting up any test data."""
     return TestClient(app)
 
 
 class TestHealthCheck:
     """Test health check endpoint."""
 
-    def test_health_check(self, client):
+    def test_health_check(self, client_bare):
         """Test that health endpoint returns 200."""
-        response = client.get("/health")
+        response = client_bare.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
@@ -241,6 +263,8 @@ class TestMinimumsEndpoint:
         assert "1" in data["1"]["10.0"]
         # minimums_array should be length 24 (hourly data 0-23)
         assert len(data["1"]["10.0"]["1"]) == 24
+        # Hours without data are null
+        assert data["2"]["10.0"]["1"][23] is None
 
 
 class TestOccupancyEndpoint:
@@ -275,19 +299,126 @@ class TestOccupancyEndpoint:
         assert response.status_code == 422  # Validation error
 
 
+class TestCachingHeaders:
+    """Test HTTP caching of immutable scenario artifacts."""
+
+    @pytest.mark.parametrize("artifact", ["scenario", "geometries", "cell_depths", "timestamps"])
+    def test_cache_headers(self, client, artifact):
+        """Test that artifacts are served with ETag and Cache-Control headers."""
+        response = client.get(f"/v1/depth/scenario/test_scenario_1/{artifact}")
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+    @pytest.mark.parametrize("artifact", ["scenario", "geometries", "cell_depths", "timestamps"])
+    def test_not_modified(self, client, artifact):
+        """Test that a matching If-None-Match returns 304 with an empty body."""
+        url = f"/v1/depth/scenario/test_scenario_1/{artifact}"
+        etag = client.get(url).headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_stale_etag(self, client):
+        """Test that a non-matching If-None-Match returns the full response."""
+        response = client.get(
+            "/v1/depth/scenario/test_scenario_1/timestamps",
+            headers={"If-None-Match": '"stale"'}
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+
+
+class FakeS3Client:
+    """Minimal S3 client serving one object and counting requests to it."""
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+        class ClientError(Exception):
+            pass
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = '"v1"'
+        self.calls = {"head_object": 0, "get_object": 0}
+
+    def head_object(self, Bucket, Key):
+        self.calls["head_object"] += 1
+        return {"ETag": self.etag}
+
+    def get_object(self, Bucket, Key):
+        self.calls["get_object"] += 1
+        return {"Body": io.BytesIO(self.body)}
+
+
+class TestMetaDataCache:
+    """Test the cached scenario metadata used by the occupancy endpoint."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the clock used for the metadata version checks."""
+        now = [1000.0]
+        monkeypatch.setattr(handlers.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(handlers, "_meta_data_versions", {})
+        return now
+
+    def test_regenerated_meta_data_is_reloaded(self, tmp_path, clock):
+        """Test that a meta_data.json rewritten in place is picked up."""
+        meta_file = tmp_path / "depth" / "scenario" / "meta_data.json"
+        meta_file.parent.mkdir(parents=True)
+        meta_file.write_bytes(orjson.dumps({"depth_bins": [10.0, 20.0]}))
+
+        meta_data, depth_bin_to_idx = load_meta_data(str(tmp_path), "scenario")
+        assert load_meta_data(str(tmp_path), "scenario")[0] is meta_data
+        assert depth_bin_to_idx == {10.0: 0, 20.0: 1}
+
+        # Regenerate the report with different depth bins
+        meta_file.write_bytes(orjson.dumps({"depth_bins": [5.0, 10.0, 20.0]}))
+        stat = meta_file.stat()
+        os.utime(meta_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Picked up once the version is re-checked
+        assert load_meta_data(str(tmp_path), "scenario")[0] is meta_data
+        clock[0] += handlers.META_DATA_CHECK_INTERVAL
+
+        meta_data, depth_bin_to_idx = load_meta_data(str(tmp_path), "scenario")
+        assert meta_data["depth_bins"] == [5.0, 10.0, 20.0]
+        assert depth_bin_to_idx == {5.0: 0, 10.0: 1, 20.0: 2}
+
+    def test_s3_version_checks_are_bounded(self, monkeypatch, clock):
+        """Test that repeated loads don't send a HEAD request each time."""
+        s3_client = FakeS3Client(orjson.dumps({"depth_bins": [10.0, 20.0]}))
+        monkeypatch.setattr(data_loader, "get_s3_client", lambda: s3_client)
+
+        for _ in range(5):
+            load_meta_data("s3://bucket/data", "scenario")
+        assert s3_client.calls == {"head_object": 1, "get_object": 1}
+
+        # An unchanged ETag is re-checked but not re-read
+        clock[0] += handlers.META_DATA_CHECK_INTERVAL
+        for _ in range(5):
+            load_meta_data("s3://bucket/data", "scenario")
+        assert s3_client.calls == {"head_object": 2, "get_object": 1}
+
+        # A new ETag is re-read
+        s3_client.body = orjson.dumps({"depth_bins": [5.0]})
+        s3_client.etag = '"v2"'
+        clock[0] += handlers.META_DATA_CHECK_INTERVAL
+        meta_data, _ = load_meta_data("s3://bucket/data", "scenario")
+        assert meta_data["depth_bins"] == [5.0]
+        assert s3_client.calls == {"head_object": 3, "get_object": 2}
+
+
 class TestErrorHandling:
     """Test error handling across endpoints."""
 
-    def test_missing_env_var(self, client):
+    def test_missing_env_var(self, client_bare, monkeypatch):
         """Test behavior when FISHFLOW_DATA_DIR is not set."""
-        # Remove the environment variable
-        original = os.environ.get("FISHFLOW_DATA_DIR")
-        if "FISHFLOW_DATA_DIR" in os.environ:
-            del os.environ["FISHFLOW_DATA_DIR"]
+        # Remove the environment variable (monkeypatch restores it afterwards)
+        monkeypatch.delenv("FISHFLOW_DATA_DIR", raising=False)
 
-        response = client.get("/v1/depth/scenario/scenarios")
+        response = client_bare.get("/v1/depth/scenario/scenarios")
         assert response.status_code == 500
-
-        # Restore environment variable
-        if original:
-            os.environ["FISHFLOW_DATA_DIR"] = original
@@ -4,10 +4,21 @@ import pytest
 import json
 import os
 from pathlib import Path
+import pandas as pd
+from app import data_loader
 from app.data_loader import (
+    S3_CONNECT_TIMEOUT,
+    S3_MAX_ATTEMPTS,
+    S3_READ_TIMEOUT,
+    get_file_version,
+    get_s3_client,
+    get_s3_filesystem,
     is_s3_path,
     parse_s3_path,
     read_json_file,
+    read_json_streaming,
+    read_file_bytes,
+    read_parquet_file,
     list_directories
 )
 
@@ -44,6 +55,44 @@ class TestS3PathHandling:
             parse_s3_path("/local/path")
 
 
+class TestS3Client:
+    """Test the shared S3 client."""
+
+    def test_get_s3_client_is_cached(self):
+        """Test that the same configured client is reused."""
+        client = get_s3_client()
+        assert get_s3_client() is client
+        assert client.meta.config.max_pool_connections == 64
+
+    def test_s3_filesystem_matches_client(self, monkeypatch):
+        """Test that parquet reads use the client's endpoint, retries and timeouts."""
+        monkeypatch.setenv("AWS_ENDPOINT_URL_S3", "http://localhost:9000")
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
+        created = []
+        monkeypatch.setattr(
+            data_loader.pafs, "S3FileSystem", lambda **kwargs: created.append(kwargs)
+        )
+        get_s3_client.cache_clear()
+        get_s3_filesystem.cache_clear()
+        try:
+            client = get_s3_client()
+            get_s3_filesystem("bucket")
+        finally:
+            get_s3_client.cache_clear()
+            get_s3_filesystem.cache_clear()
+
+        assert client.meta.endpoint_url == "http://localhost:9000"
+        assert client.meta.config.connect_timeout == S3_CONNECT_TIMEOUT
+        assert client.meta.config.read_timeout == S3_READ_TIMEOUT
+
+        kwargs, = created
+        assert kwargs["endpoint_override"] == "http://localhost:9000"
+        assert kwargs["region"] == "us-west-2"
+        assert kwargs["connect_timeout"] == S3_CONNECT_TIMEOUT
+        assert kwargs["request_timeout"] == S3_READ_TIMEOUT
+        assert kwargs["retry_strategy"].max_attempts == S3_MAX_ATTEMPTS
+
+
 class TestLocalFileOperations:
     """Test local file system operations."""
 
@@ -88,6 +137,75 @@ class TestLocalFileOperations:
         with pytest.raises(ValueError):
             read_json_file(str(temp_data_dir), "invalid.json")
 
+    def test_read_json_streaming_local(self, temp_data_dir):
+        """Test streaming top level entries of a local JSON file."""
+        entries = dict(read_json_streaming(str(temp_data_dir), "depth/scenario1/test.json"))
+        assert entries == {"test": "data", "value": 123}
+
+    def test_read_json_streaming_not_found(self, temp_data_dir):
+        """Test that FileNotFoundError is raised when streaming missing files."""
+        with pytest.raises(FileNotFoundError):
+            list(read_json_streaming(str(temp_data_dir), "depth/nonexistent/test.json"))
+
+    def test_read_json_streaming_invalid_json(self, temp_data_dir):
+        """Test that ValueError is raised when streaming invalid JSON."""
+        invalid_file = temp_data_dir / "invalid.json"
+        with open(invalid_file, 'w') as f:
+            f.write('{"a": [1, 2')
+
+        with pytest.raises(ValueError):
+            list(read_json_streaming(str(temp_data_dir), "invalid.json"))
+
+    def test_read_file_bytes_local(self, temp_data_dir):
+        """Test reading raw bytes from local filesystem."""
+        data = read_file_bytes(str(temp_data_dir), "depth/scenario1/test.json")
+        assert json.loads(data) == {"test": "data", "value": 123}
+
+    def test_read_file_bytes_not_found(self, temp_data_dir):
+        """Test that FileNotFoundError is raised for missing files."""
+        with pytest.raises(FileNotFoundError):
+            read_file_bytes(str(temp_data_dir), "depth/nonexistent/test.json")
+
+    def test_get_file_version_changes_on_rewrite(self, temp_data_dir):
+        """Test that rewriting a file changes its version."""
+        path = "depth/scenario1/test.json"
+        version = get_file_version(str(temp_data_dir), path)
+        assert get_file_version(str(temp_data_dir), path) == version
+
+        full_path = temp_data_dir / path
+        full_path.write_text(json.dumps({"test": "rewritten"}))
+        stat = full_path.stat()
+        os.utime(full_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert get_file_version(str(temp_data_dir), path) != version
+
+    def test_get_file_version_not_found(self, temp_data_dir):
+        """Test that FileNotFoundError is raised for missing files."""
+        with pytest.raises(FileNotFoundError):
+            get_file_version(str(temp_data_dir), "depth/nonexistent/test.json")
+
+    def test_read_parquet_file_columns(self, temp_data_dir):
+        """Test reading only a subset of parquet columns."""
+        df = pd.DataFrame({str(i): [float(i), float(i) + 0.5] for i in range(4)})
+        df.to_parquet(temp_data_dir / "test.parquet")
+
+        subset = read_parquet_file(str(temp_data_dir), "test.parquet", columns=["1", "3"])
+        assert len(subset.columns) == 2
+        assert subset.iloc[:, 0].tolist() == [1.0, 1.5]
+        assert subset.iloc[:, 1].tolist() == [3.0, 3.5]
+
+    def test_read_parquet_file_missing_column(self, temp_data_dir):
+        """Test that KeyError is raised for columns not in the file."""
+        pd.DataFrame({"0": [1.0]}).to_parquet(temp_data_dir / "test.parquet")
+
+        with pytest.raises(KeyError):
+            read_parquet_file(str(temp_data_dir), "test.parquet", columns=["5"])
+
+    def test_read_parquet_file_not_found(self, temp_data_dir):
+        """Test that FileNotFoundError is raised for missing parquet files."""
+        with pytest.raises(FileNotFoundError):
+            read_parquet_file(str(temp_data_dir), "missing.parquet")
+
     def test_list_directories_local(self, temp_data_dir):
         """Test listing directories from local filesystem."""
         dirs = list_directories(str(temp_data_dir), "depth")
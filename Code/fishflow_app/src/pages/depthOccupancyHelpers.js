@@ -212,7 +212,8 @@ export function calculateFilteredMinimums(minimums, cell_depths, selectedMonths,
       }
 
       for (const hour of selectedHours) {
-        if (hour < hourArray.length) {
+        // Hours without data are null and must not count as a zero minimum
+        if (hour < hourArray.length && hourArray[hour] !== null) {
           minValue = Math.min(minValue, hourArray[hour]);
         }
       }
@@ -41,76 +41,81 @@ def generate_synthetic_data():
     print(f"  Using {len(depth_bins)} depth bins: {depth_bins}")
 
     # Generate decisions and choices
-    decision_id = 0
-    rows = []
-
-    for timestamp in timestamps:
-        for h3_idx in h3_indices:
-            # Create one decision per (time, location)
-            for depth in depth_bins:
-                rows.append(
-                    {
-                        "_decision": decision_id,
-                        "_choice": f"depth_{depth}_loc_{h3_idx[:6]}",
-                        "datetime": timestamp,
-                        "h3_index": h3_idx,
-                        "depth_bin": depth,
-                    }
-                )
-            decision_id += 1
-
-    context_df = pd.DataFrame(rows)
-
-    print(f"  Generated {len(context_df)} choice-contexts ({decision_id} decisions)")
-
-    # Generate model predictions (complex model with depth-time patterns)
-    model_rows = []
-    for decision in context_df["_decision"].unique():
-        decision_data = context_df[context_df["_decision"] == decision]
-
-        # Parse timestamp to get hour of day
-        dt = pd.to_datetime(decision_data.iloc[0]["datetime"])
-        hour = dt.hour
+    # One decision per (time, location), with one choice per depth bin.
+    # Rows are ordered by timestamp, then location, then depth bin
+    n_times, n_cells, n_depths = len(timestamps), len(h3_indices), len(depth_bins)
+    n_decisions = n_times * n_cells
+
+    # Choice labels only depend on (location, depth), so build them once
+    # per location and repeat them for every timestamp
+    cell_choices = np.array(
+        [
+            f"depth_{depth}_loc_{h3_idx[:6]}"
+            for h3_idx in h3_indices
+            for depth in depth_bins
+        ],
+        dtype=object,
+    )
 
-        # Simulate depth preference: deeper during day, shallower at night
-        # Peak at noon (hour 12), minimum at midnight (hour 0)
-        time_factor = np.cos((hour - 12) * 2 * np.pi / 24)
+    context_df = pd.DataFrame(
+        {
+            "_decision": np.repeat(np.arange(n_decisions), n_depths),
+            "_choice": np.tile(cell_choices, n_times),
+            "datetime": np.repeat(
+                np.array(timestamps, dtype="datetime64[ns]"), n_cells * n_depths
+            ),
+            "h3_index": np.tile(
+                np.repeat(np.array(h3_indices, dtype=object), n_depths), n_times
+            ),
+            "depth_bin": np.tile(np.array(depth_bins, dtype=np.float64), n_decisions),
+        },
+        copy=False,
+    )
 
-        # Generate probabilities that favor deeper water during day
-        depths = decision_data["depth_bin"].values
+    print(f"  Generated {len(context_df)} choice-contexts ({n_decisions} decisions)")
 
-        # Deeper preference when time_factor is positive (daytime)
-        if time_factor > 0:
-            # Favor deeper bins
-            logits = depths / 20.0 + np.random.normal(0, 0.5, len(depths))
-        else:
-            # Favor shallower bins
-            logits = -depths / 20.0 + np.random.normal(0, 0.5, len(depths))
+    # Generate model predictions (complex model with depth-time patterns)
+    # Decisions are contiguous in context_df, so each one is a slice that
+    # starts at decision_starts and the softmax can be done per segment
+    decisions = context_df["_decision"].to_numpy()
+    _, decision_starts, decision_sizes = np.unique(
+        decisions, return_index=True, return_counts=True
+    )
 
-        # Convert to probabilities
-        probs = np.exp(logits)
-        probs = probs / probs.sum()
+    # Simulate depth preference: deeper during day, shallower at night
+    # Peak at noon (hour 12), minimum at midnight (hour 0)
+    hours = context_df["datetime"].dt.hour.to_numpy()
+    time_factor = np.cos((hours - 12) * 2 * np.pi / 24)
 
-        for choice, prob in zip(decision_data["_choice"], probs):
-            model_rows.append(
-                {"_decision": decision, "_choice": choice, "probability": prob}
-            )
+    # Generate probabilities that favor deeper water during day and
+    # shallower water at night
+    depths = context_df["depth_bin"].to_numpy()
+    logits = np.where(time_factor > 0, depths, -depths) / 20.0
+    logits = logits + np.random.normal(0, 0.5, len(depths))
 
-    model_df = pd.DataFrame(model_rows)
+    # Convert to probabilities with a softmax over each decision
+    logits = logits - np.repeat(
+        np.maximum.reduceat(logits, decision_starts), decision_sizes
+    )
+    probs = np.exp(logits)
+    probs = probs / np.repeat(np.add.reduceat(probs, decision_starts), decision_sizes)
+
+    model_df = pd.DataFrame(
+        {
+            "_decision": decisions,
+            "_choice": context_df["_choice"].to_numpy(),
+            "probability": probs,
+        }
+    )
 
     # Generate reference model (uniform across depth bins)
-    reference_rows = []
-    for decision in context_df["_decision"].unique():
-        choices = context_df[context_df["_decision"] == decision]["_choice"]
-        n_choices = len(choices)
-        uniform_prob = 1.0 / n_choices
-
-        for choice in choices:
-            reference_rows.append(
-                {"_decision": decision, "_choice": choice, "probability": uniform_prob}
-            )
-
-    reference_df = pd.DataFrame(reference_rows)
+    reference_df = pd.DataFrame(
+        {
+            "_decision": decisions,
+            "_choice": context_df["_choice"].to_numpy(),
+            "probability": np.repeat(1.0 / decision_sizes, decision_sizes),
+        }
+    )
 
     # Generate validation data (subset of decisions with observations)
     n_validation = 50
@@ -125,19 +130,25 @@ def generate_synthetic_data():
     ].copy()
 
     # Selections (simulated observations)
-    # Sample from model predictions to create realistic selections
-    selections = []
-    for decision in validation_decisions:
-        decision_model = model_actuals_df[model_actuals_df["_decision"] == decision]
-
-        # Sample choice based on model probabilities
-        selected_choice = np.random.choice(
-            decision_model["_choice"].values, p=decision_model["probability"].values
-        )
-
-        selections.append({"_decision": decision, "_choice": selected_choice})
-
-    selections_df = pd.DataFrame(selections)
+    # Sample one choice per decision from the model predictions by inverting
+    # each decision's cumulative distribution. model_actuals_df keeps the
+    # contiguous decision order of model_df, so one cumulative sum covers
+    # every decision and each draw is offset into its own decision's range
+    _, actual_starts, actual_sizes = np.unique(
+        model_actuals_df["_decision"].to_numpy(), return_index=True, return_counts=True
+    )
+    actual_ends = actual_starts + actual_sizes - 1
+    cumulative = np.cumsum(model_actuals_df["probability"].to_numpy())
+    lower = np.concatenate([[0.0], cumulative[actual_ends[:-1]]])
+    draws = lower + np.random.random(len(actual_starts)) * (cumulative[actual_ends] - lower)
+    selected = np.minimum(np.searchsorted(cumulative, draws, side="right"), actual_ends)
+
+    selections_df = pd.DataFrame(
+        {
+            "_decision": model_actuals_df["_decision"].to_numpy()[selected],
+            "_choice": model_actuals_df["_choice"].to_numpy()[selected],
+        }
+    )
 
     print(
         f"  Generated {len(validation_decisions)} validation decisions with observations"
@@ -215,7 +226,7 @@ def main():
     print("  - cell_depths.json        (maximum depth per cell)")
     print("  - minimums.json           (minimum occupancy stats)")
     print("  - timestamps.json         (timeline)")
-    print("  - *_occupancy.parquet.gz  (occupancy time series per cell)")
+    print("  - *_occupancy.parquet     (occupancy time series per cell)")
     print("\nYou can now load this report in the FishFlow app for visualization.")
     print()
 
@@ -37,36 +37,42 @@ def build_geojson_h3(context_df: pd.DataFrame) -> Tuple[Dict[str, Any], pd.DataF
     if not required_cols.issubset(context_df.columns):
         raise ValueError(f"context_df must have columns {required_cols}")
 
-    # Get unique H3 indices in alphabetical order
-    unique_h3_indices = sorted(context_df['h3_index'].unique())
-
-    # Create cell_id mapping (alphabetical order, starting from 0)
-    h3_to_cell_id = {h3_index: i for i, h3_index in enumerate(unique_h3_indices)}
+    # Get unique H3 indices in alphabetical order along with each row's
+    # position in them in a single hashed pass (cell_id is the position in
+    # this order, starting from 0)
+    cell_ids, unique_h3_indices = pd.factorize(context_df['h3_index'], sort=True)
+
+    # Get boundary coordinates from H3 for every cell up front
+    # h3.cell_to_boundary returns lat/lon pairs, we need lon/lat for GeoJSON
+    boundaries = [h3.cell_to_boundary(h3_index) for h3_index in unique_h3_indices]
+
+    # Swap the columns to [lon, lat] and close the polygons (GeoJSON polygons
+    # should be closed, first point == last point) in bulk, stacking the
+    # boundaries with the same number of vertices (6 for hexagons, 5 for
+    # pentagons, more where a cell crosses an icosahedron edge)
+    n_vertices = np.array([len(boundary) for boundary in boundaries], dtype=int)
+    coordinates = [None] * len(boundaries)
+    for n in np.unique(n_vertices):
+        cell_indices = np.flatnonzero(n_vertices == n)
+        stacked = np.array([boundaries[i] for i in cell_indices])
+        closed = stacked[:, np.r_[0:n, 0], ::-1].tolist()
+        for cell_idx, polygon in zip(cell_indices, closed):
+            coordinates[cell_idx] = polygon
 
     # Build GeoJSON features
-    features = []
-    for h3_index in unique_h3_indices:
-        cell_id = h3_to_cell_id[h3_index]
-
-        # Get boundary coordinates from H3
-        # h3.cell_to_boundary returns lat/lon pairs, we need lon/lat for GeoJSON
-        boundary = h3.cell_to_boundary(h3_index)
-        # Convert (lat, lon) to [lon, lat] and close the polygon
-        coordinates = [[lon, lat] for lat, lon in boundary]
-        # GeoJSON polygons should be closed (first point == last point)
-        coordinates.append(coordinates[0])
-
-        feature = {
+    features = [
+        {
             "type": "Feature",
             "geometry": {
                 "type": "Polygon",
-                "coordinates": [coordinates]
+                "coordinates": [polygon]
             },
             "properties": {
                 "cell_id": cell_id
             }
         }
-        features.append(feature)
+        for cell_id, polygon in enumerate(coordinates)
+    ]
 
     # Create GeoJSON FeatureCollection
     geojson = {
@@ -75,13 +81,30 @@ def build_geojson_h3(context_df: pd.DataFrame) -> Tuple[Dict[str, Any], pd.DataF
     }
 
     # Create cell_id dataframe
-    cell_id_df = context_df[['_decision', '_choice', 'h3_index']].copy()
-    cell_id_df['cell_id'] = cell_id_df['h3_index'].map(h3_to_cell_id)
-    cell_id_df = cell_id_df.drop('h3_index', axis=1)
+    cell_id_df = context_df[['_decision', '_choice']].assign(
+        cell_id=cell_ids.astype(np.int32)
+    )
 
     return geojson, cell_id_df
 
 
+def to_datetime64(values: Any) -> np.ndarray:
+    """
+    Parse datetimes into a datetime64[ns] NumPy array.
+
+    Parsing is skipped if the values are already datetime64, so callers can
+    pass a column that was parsed once up front without paying for it again.
+
+    Args:
+        values: Array-like (e.g. a DataFrame column) of datetimes or
+            datetime strings.
+
+    Returns:
+        Array of dtype datetime64[ns].
+    """
+    return np.asarray(pd.to_datetime(values, cache=True), dtype='datetime64[ns]')
+
+
 def build_timeline(context_df: pd.DataFrame) -> np.ndarray:
     """
     Extract ordered timeline from context dataframe.
@@ -90,7 +113,7 @@ def build_timeline(context_df: pd.DataFrame) -> np.ndarray:
         context_df: DataFrame with at least columns '_decision', '_choice', 'datetime'.
 
     Returns:
-        Sorted array of unique datetime values.
+        Sorted datetime64[ns] array of unique datetime values.
 
     Raises:
         ValueError: If required columns are missing.
@@ -100,7 +123,8 @@ def build_timeline(context_df: pd.DataFrame) -> np.ndarray:
     if not required_cols.issubset(context_df.columns):
         raise ValueError(f"context_df must have columns {required_cols}")
 
-    # Extract unique datetimes and sort
-    timeline = sorted(context_df['datetime'].unique())
+    # Deduplicate with a hash pass first, so only the unique values (not
+    # every row) need parsing and sorting
+    unique_datetimes = to_datetime64(pd.unique(context_df['datetime']))
 
-    return np.array(timeline)
+    return np.unique(unique_datetimes)
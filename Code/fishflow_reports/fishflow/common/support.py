@@ -6,16 +6,38 @@ of model mixtures using Bayesian model interpolation between a complex model and
 a simpler reference model.
 """
 
+import hashlib
+import os
+import tempfile
 import numpy as np
 import pandas as pd
 from typing import Optional, Tuple
 
 
+def _validate_selection_indices(selection_indices: np.ndarray, shape: Tuple[int, int]) -> None:
+    """
+    Check that selection indices pick one choice per decision.
+
+    Args:
+        selection_indices: Array of selected choice (column) indices.
+        shape: Shape (N_D, N_C) of the model matrices being indexed.
+
+    Raises:
+        ValueError: If there is not one index per decision or an index is
+            not a valid choice.
+    """
+    if selection_indices.shape != (shape[0],):
+        raise ValueError("selection_indices must have one entry per decision (row) of the model matrices")
+
+    if np.any((selection_indices < 0) | (selection_indices >= shape[1])):
+        raise ValueError("selection_indices must index a choice (column) of the model matrices")
+
+
 def log_likelihood_member(
     epsilon: float,
     reference_model_matrix: np.ndarray,
     model_matrix: np.ndarray,
-    selections_matrix: np.ndarray
+    selection_indices: np.ndarray
 ) -> float:
     """
     Compute log likelihood of data given a specific mixture model.
@@ -32,8 +54,8 @@ def log_likelihood_member(
             probabilities for each choice in each decision for the reference model.
         model_matrix: Array of shape (N_D, N_C) containing probabilities
             for each choice in each decision for the complex model.
-        selections_matrix: Binary array of shape (N_D, N_C) indicating which
-            choice was selected for each decision (one 1 per row, rest 0s).
+        selection_indices: Integer array of shape (N_D,) with the column index
+            of the choice selected in each decision.
 
     Returns:
         Log likelihood of the observed data given the mixture model defined by epsilon.
@@ -48,23 +70,30 @@ def log_likelihood_member(
     if reference_model_matrix.shape != model_matrix.shape:
         raise ValueError("reference_model_matrix and model_matrix must have same shape")
 
-    if reference_model_matrix.shape != selections_matrix.shape:
-        raise ValueError("selections_matrix must have same shape as model matrices")
+    _validate_selection_indices(selection_indices, model_matrix.shape)
 
     # Compute mixture odds: O = epsilon * G_H + (1 - epsilon) * G_B
-    odds = epsilon * model_matrix + (1 - epsilon) * reference_model_matrix
-
-    # Normalize to get probabilities: divide each element by its row sum
-    row_sums = odds.sum(axis=1, keepdims=True)
+    # Only the row sums of O and the odds of the selected choices are needed,
+    # and both are linear in the matrices, so reduce G_H and G_B per row first
+    # rather than materializing O and its normalized probabilities
+    # (accumulating in float64 whatever the storage dtype of the matrices)
+    row_sums = (
+        epsilon * model_matrix.sum(axis=1, dtype=np.float64)
+        + (1 - epsilon) * reference_model_matrix.sum(axis=1, dtype=np.float64)
+    )
 
     # Avoid division by zero
     if np.any(row_sums == 0):
         raise ValueError("Row sums of odds cannot be zero")
 
-    probabilities = odds / row_sums
-
-    # Extract probabilities for selected choices
-    selected_probs = (probabilities * selections_matrix).sum(axis=1)
+    # Extract probabilities for selected choices by gathering the selected
+    # column of each row
+    rows = np.arange(len(selection_indices))
+    selected_odds = (
+        epsilon * model_matrix[rows, selection_indices].astype(np.float64)
+        + (1 - epsilon) * reference_model_matrix[rows, selection_indices].astype(np.float64)
+    )
+    selected_probs = selected_odds / row_sums
 
     # Avoid log(0)
     if np.any(selected_probs <= 0):
@@ -79,7 +108,7 @@ def log_likelihood_member(
 def prob_members(
     reference_model_matrix: np.ndarray,
     model_matrix: np.ndarray,
-    selections_matrix: np.ndarray,
+    selection_indices: np.ndarray,
     epsilons: np.ndarray,
     prior_probs: Optional[np.ndarray] = None
 ) -> np.ndarray:
@@ -94,8 +123,8 @@ def prob_members(
             probabilities for each choice in each decision for the reference model.
         model_matrix: Array of shape (N_D, N_C) containing probabilities
             for each choice in each decision for the complex model.
-        selections_matrix: Binary array of shape (N_D, N_C) indicating which
-            choice was selected for each decision.
+        selection_indices: Integer array of shape (N_D,) with the column index
+            of the choice selected in each decision.
         epsilons: Array of epsilon values (0 to 1, sorted low to high) defining
             the mixture family members.
         prior_probs: Optional array of prior probabilities for each epsilon.
@@ -126,28 +155,72 @@ def prob_members(
     if not np.isclose(prior_probs.sum(), 1.0):
         raise ValueError("prior_probs must sum to 1")
 
-    # Compute log likelihoods for each epsilon
-    log_likelihoods = np.zeros(n_epsilons)
-    for i, epsilon in enumerate(epsilons):
-        log_likelihoods[i] = log_likelihood_member(
-            epsilon, reference_model_matrix, model_matrix, selections_matrix
-        )
+    if reference_model_matrix.shape != model_matrix.shape:
+        raise ValueError("reference_model_matrix and model_matrix must have same shape")
+
+    _validate_selection_indices(selection_indices, model_matrix.shape)
+
+    # Compute log likelihoods for every epsilon at once (see log_likelihood_member).
+    # The mixture odds are linear in epsilon, so both the selected odds and the
+    # row sums of the odds can be built from per-decision reductions of the
+    # input matrices (a gather of the selected column of each row and the row
+    # sums), rather than a full pass over the matrices per epsilon
+    rows = np.arange(len(selection_indices))
+    # The matrices may be stored in float32, the reductions are done in float64
+    selected_model = model_matrix[rows, selection_indices].astype(np.float64)
+    selected_reference = reference_model_matrix[rows, selection_indices].astype(np.float64)
+    row_model = model_matrix.sum(axis=1, dtype=np.float64)
+    row_reference = reference_model_matrix.sum(axis=1, dtype=np.float64)
+
+    # Shape (n_epsilons, N_D)
+    eps = epsilons[:, np.newaxis]
+    selected_odds = eps * selected_model + (1 - eps) * selected_reference
+    row_sums = eps * row_model + (1 - eps) * row_reference
+
+    # Avoid division by zero
+    if np.any(row_sums == 0):
+        raise ValueError("Row sums of odds cannot be zero")
+
+    selected_probs = selected_odds / row_sums
+
+    # Avoid log(0)
+    if np.any(selected_probs <= 0):
+        raise ValueError("Selected probabilities must be positive")
+
+    log_likelihoods = np.log(selected_probs).sum(axis=1)
 
     # Add log priors
     log_priors = np.log(prior_probs)
     log_posteriors_unnormalized = log_priors + log_likelihoods
 
-    # Use log-sum-exp trick for numerical stability
-    # Subtract maximum to prevent overflow
-    max_log_posterior = log_posteriors_unnormalized.max()
+    # Normalize in log space (log-sum-exp is numerically stable) to get
+    # posterior probabilities
+    log_evidence = np.logaddexp.reduce(log_posteriors_unnormalized)
+    posteriors = np.exp(log_posteriors_unnormalized - log_evidence)
 
-    # Compute ratios relative to maximum
-    ratios = np.exp(log_posteriors_unnormalized - max_log_posterior)
+    return posteriors
 
-    # Normalize to get posterior probabilities
-    posteriors = ratios / ratios.sum()
 
-    return posteriors
+def _as_float32_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    """
+    Cast probabilities to float32 without flushing tiny ones to zero.
+
+    Positive probabilities below the smallest normal float32 are raised to it,
+    so a valid (positive) probability never becomes zero and fails the
+    positivity checks in log_likelihood_member/prob_members.
+
+    Args:
+        probabilities: Array of probabilities.
+
+    Returns:
+        float32 array of the probabilities.
+    """
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    tiny = np.finfo(np.float32).tiny
+
+    return np.where(
+        probabilities > 0, np.maximum(probabilities, tiny), probabilities
+    ).astype(np.float32)
 
 
 def build_model_matrices(
@@ -170,8 +243,11 @@ def build_model_matrices(
             only the actually selected choices (one per decision).
 
     Returns:
-        Tuple of (model_matrix, reference_model_matrix, selections_matrix)
-        where each matrix has shape (N_D, N_C).
+        Tuple of (model_matrix, reference_model_matrix, selection_indices)
+        where the matrices are C-contiguous float32 arrays of shape (N_D, N_C)
+        (positive probabilities below np.finfo(np.float32).tiny are stored
+        as that value) and selection_indices is an int32 array of shape (N_D,) with the
+        column of the selected choice in each decision.
 
     Raises:
         ValueError: If inputs are invalid or incompatible.
@@ -200,53 +276,79 @@ def build_model_matrices(
     decisions = sorted(model_df['_decision'].unique())
     all_choices = sorted(model_df['_choice'].unique())
 
-    # Create index mappings
-    decision_to_idx = {d: i for i, d in enumerate(decisions)}
-    choice_to_idx = {c: i for i, c in enumerate(all_choices)}
-
     n_decisions = len(decisions)
     n_choices = len(all_choices)
 
     # Initialize matrices
-    model_matrix = np.zeros((n_decisions, n_choices))
-    reference_model_matrix = np.zeros((n_decisions, n_choices))
-    selections_matrix = np.zeros((n_decisions, n_choices))
+    model_matrix = np.zeros((n_decisions, n_choices), dtype=np.float32)
+    reference_model_matrix = np.zeros((n_decisions, n_choices), dtype=np.float32)
+
+    # Row/column indices come from the position of each decision/choice in
+    # the sorted categories (-1 if it is not one of them)
+    decision_categories = pd.CategoricalDtype(decisions)
+    choice_categories = pd.CategoricalDtype(all_choices)
 
     # Fill model matrices
-    for _, row in model_df.iterrows():
-        i = decision_to_idx[row['_decision']]
-        j = choice_to_idx[row['_choice']]
-        model_matrix[i, j] = row['probability']
+    rows = model_df['_decision'].astype(decision_categories).cat.codes.to_numpy()
+    cols = model_df['_choice'].astype(choice_categories).cat.codes.to_numpy()
+    model_matrix[rows, cols] = _as_float32_probabilities(model_df['probability'].to_numpy())
 
-    for _, row in reference_model_df.iterrows():
-        i = decision_to_idx[row['_decision']]
-        j = choice_to_idx[row['_choice']]
-        reference_model_matrix[i, j] = row['probability']
+    rows = reference_model_df['_decision'].astype(decision_categories).cat.codes.to_numpy()
+    cols = reference_model_df['_choice'].astype(choice_categories).cat.codes.to_numpy()
+    reference_model_matrix[rows, cols] = _as_float32_probabilities(reference_model_df['probability'].to_numpy())
 
     # Fill selections matrix
-    for _, row in selections_df.iterrows():
-        if row['_decision'] not in decision_to_idx:
-            raise ValueError(f"Decision {row['_decision']} in selections not found in model data")
-        if row['_choice'] not in choice_to_idx:
-            raise ValueError(f"Choice {row['_choice']} in selections not found in model data")
-
-        i = decision_to_idx[row['_decision']]
-        j = choice_to_idx[row['_choice']]
-        selections_matrix[i, j] = 1
-
-    # Validate selections matrix (exactly one selection per decision)
-    row_sums = selections_matrix.sum(axis=1)
-    if not np.all(row_sums == 1):
+    rows = selections_df['_decision'].astype(decision_categories).cat.codes.to_numpy()
+    cols = selections_df['_choice'].astype(choice_categories).cat.codes.to_numpy()
+    if np.any(rows < 0):
+        missing = selections_df['_decision'].to_numpy()[rows < 0][0]
+        raise ValueError(f"Decision {missing} in selections not found in model data")
+    if np.any(cols < 0):
+        missing = selections_df['_choice'].to_numpy()[cols < 0][0]
+        raise ValueError(f"Choice {missing} in selections not found in model data")
+
+    # Validate selections (exactly one selection per decision)
+    if not np.all(np.bincount(rows, minlength=n_decisions) == 1):
         raise ValueError("Each decision must have exactly one selected choice")
 
-    return model_matrix, reference_model_matrix, selections_matrix
+    selection_indices = np.empty(n_decisions, dtype=np.int32)
+    selection_indices[rows] = cols
 
+    return model_matrix, reference_model_matrix, selection_indices
 
-def compute_support(
+
+def _support_cache_key(
     model_df: pd.DataFrame,
     reference_model_df: pd.DataFrame,
     selections_df: pd.DataFrame,
     epsilons: np.ndarray
+) -> str:
+    """
+    Hash the inputs of compute_support into a stable cache key.
+
+    Args:
+        model_df: DataFrame passed to compute_support.
+        reference_model_df: DataFrame passed to compute_support.
+        selections_df: DataFrame passed to compute_support.
+        epsilons: Array of epsilon values passed to compute_support.
+
+    Returns:
+        Hex digest identifying the inputs.
+    """
+    digest = hashlib.sha1()
+    for df in (model_df, reference_model_df, selections_df):
+        digest.update(repr(list(df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(np.asarray(epsilons, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def compute_support(
+    model_df: pd.DataFrame,
+    reference_model_df: pd.DataFrame,
+    selections_df: pd.DataFrame,
+    epsilons: np.ndarray,
+    cache_dir: Optional[str] = None
 ) -> np.ndarray:
     """
     Compute support (posterior probability) for model mixture family.
@@ -262,6 +364,9 @@ def compute_support(
         selections_df: DataFrame with columns '_decision', '_choice' containing
             only the actually selected choices (one per decision).
         epsilons: Array of epsilon values (0 to 1) defining the mixture family.
+        cache_dir: Optional directory to cache the support in. The support is
+            saved there keyed by a hash of the inputs and reused on later calls
+            with identical inputs. If None, nothing is cached.
 
     Returns:
         Array of posterior probabilities (support) for each epsilon value.
@@ -269,8 +374,22 @@ def compute_support(
     Raises:
         ValueError: If inputs are invalid or incompatible.
     """
+    cache_file = None
+    if cache_dir is not None:
+        cache_key = _support_cache_key(model_df, reference_model_df, selections_df, epsilons)
+        cache_file = os.path.join(cache_dir, f'{cache_key}.npy')
+        if os.path.exists(cache_file):
+            # A damaged cache file (e.g. from an older, interrupted run) is
+            # recomputed and replaced rather than trusted
+            try:
+                cached = np.load(cache_file)
+            except (OSError, ValueError, EOFError):
+                cached = None
+            if cached is not None and cached.shape == (len(epsilons),):
+                return cached
+
     # Build matrices
-    model_matrix, reference_model_matrix, selections_matrix = build_model_matrices(
+    model_matrix, reference_model_matrix, selection_indices = build_model_matrices(
         model_df, reference_model_df, selections_df
     )
 
@@ -278,13 +397,43 @@ def compute_support(
     support = prob_members(
         reference_model_matrix,
         model_matrix,
-        selections_matrix,
+        selection_indices,
         epsilons
     )
 
+    if cache_file is not None:
+        # Write to a temporary file and move it into place so that an
+        # interrupted or concurrent run never leaves a partial cache file
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.npy.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, support)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
     return support
 
 
+def _take_rows(series: pd.Series, row_indices: np.ndarray):
+    """
+    Take rows of a series as an array, keeping its dtype.
+
+    Args:
+        series: Series to take from.
+        row_indices: Positions of the rows to take.
+
+    Returns:
+        The taken values, an extension array for extension dtypes (e.g.
+        categoricals) and a NumPy array otherwise.
+    """
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        return series.array.take(row_indices)
+    return series.to_numpy().take(row_indices)
+
+
 def compute_mixtures(
     model_df: pd.DataFrame,
     reference_model_df: pd.DataFrame,
@@ -335,31 +484,44 @@ def compute_mixtures(
     if 'probability' in merged.columns:
         merged = merged.drop('probability', axis=1)
 
-    # Cross join with epsilons
-    epsilon_df = pd.DataFrame({'epsilon': epsilons})
-    epsilon_df['_key'] = 1
-    merged['_key'] = 1
-
-    mixtures = merged.merge(epsilon_df, on='_key').drop('_key', axis=1)
-
-    # Compute mixture odds: epsilon * prob_model + (1 - epsilon) * prob_reference
-    mixtures['odds'] = (
-        mixtures['epsilon'] * mixtures['prob_model'] +
-        (1 - mixtures['epsilon']) * mixtures['prob_reference']
-    )
-
-    # Compute sum of odds per (decision, epsilon) group
-    odds_sums = mixtures.groupby(['_decision', 'epsilon'])['odds'].transform('sum')
-
-    # Compute mixture probability
-    mixtures['probability'] = mixtures['odds'] / odds_sums
+    n_rows = len(merged)
+    n_epsilons = len(epsilons)
 
-    # Clean up temporary columns
-    mixtures = mixtures.drop(['prob_model', 'prob_reference', 'odds'], axis=1)
+    # Compute mixture odds for every row and epsilon by broadcasting, shape
+    # (n_rows, n_epsilons): epsilon * prob_model + (1 - epsilon) * prob_reference
+    eps = np.asarray(epsilons, dtype=float)[np.newaxis, :]
+    prob_model = merged['prob_model'].to_numpy()[:, np.newaxis]
+    prob_reference = merged['prob_reference'].to_numpy()[:, np.newaxis]
+    odds = eps * prob_model + (1 - eps) * prob_reference
+
+    # Compute sum of odds per (decision, epsilon) group, with one bincount
+    # per epsilon (np.add.at is unbuffered and slow before NumPy 1.25)
+    decision_codes, decisions = pd.factorize(merged['_decision'])
+    odds_sums = np.zeros((len(decisions), n_epsilons))
+    for i in range(n_epsilons):
+        odds_sums[:, i] = np.bincount(
+            decision_codes, weights=odds[:, i], minlength=len(decisions)
+        )
 
-    # Reorder columns: keys first, then epsilon, probability, then any other context
-    key_cols = ['_decision', '_choice', 'epsilon', 'probability']
-    other_cols = [c for c in mixtures.columns if c not in key_cols]
-    mixtures = mixtures[key_cols + other_cols]
+    # Expand to one row per (row, epsilon), rows first then epsilons within
+    # each row, building every column as an array and the dataframe in one
+    # go. Columns are ordered keys first, then epsilon, probability, then any
+    # other context
+    row_indices = np.repeat(np.arange(n_rows), n_epsilons)
+
+    other_cols = [
+        c for c in merged.columns
+        if c not in ('_decision', '_choice', 'prob_model', 'prob_reference', 'epsilon')
+    ]
+    columns = {
+        '_decision': _take_rows(merged['_decision'], row_indices),
+        '_choice': _take_rows(merged['_choice'], row_indices),
+        'epsilon': np.tile(eps[0], n_rows),
+        'probability': (odds / odds_sums[decision_codes]).ravel(),
+    }
+    for col in other_cols:
+        columns[col] = _take_rows(merged[col], row_indices)
+
+    mixtures = pd.DataFrame(columns)
 
     return mixtures
@@ -5,21 +5,204 @@ This module creates comprehensive depth occupancy reports by combining
 model predictions with Bayesian model interpolation to quantify uncertainty.
 """
 
+import multiprocessing
 import os
-import json
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import h3
+import orjson
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from ..common.support import compute_support, compute_mixtures
-from ..common.spacetime import build_geojson_h3, build_timeline
+from ..common.spacetime import build_geojson_h3, build_timeline, to_datetime64
 
 
-def build_minimums(
+def _write_json(path: str, obj: Any, indent: bool = False) -> None:
+    """
+    Write an object to a JSON file with orjson.
+
+    Args:
+        path: File to write.
+        obj: Object to serialize. NumPy arrays/scalars and non-string dict
+            keys (written as strings) are supported.
+        indent: Whether to pretty print with an indent of 2.
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(obj, option=option))
+
+
+def _as_shared_categories(frames: List[pd.DataFrame], column: str) -> List[pd.DataFrame]:
+    """
+    Cast a key column to one categorical dtype shared by several dataframes.
+
+    Merges and groupbys on categoricals with identical categories compare
+    integer codes rather than hashing the original values.
+
+    Args:
+        frames: DataFrames that all have the column.
+        column: Name of the column to cast.
+
+    Returns:
+        Copies of the dataframes with the column cast to the shared dtype.
+    """
+    dtype = pd.CategoricalDtype(pd.concat([frame[column] for frame in frames]).unique())
+    return [frame.astype({column: dtype}) for frame in frames]
+
+
+def _positions(values: np.ndarray, sorted_values: np.ndarray, name: str) -> np.ndarray:
+    """
+    Find the position of each value in a sorted array of known values.
+
+    Args:
+        values: Values to look up.
+        sorted_values: Sorted array containing every value.
+        name: Name of the values, used in the error message.
+
+    Returns:
+        Integer array of positions in sorted_values, one per value.
+
+    Raises:
+        ValueError: If any value is not in sorted_values.
+    """
+    error = ValueError(f"mixture_df contains {name} not found in {name}")
+
+    # Nothing can be found in an empty array (and there is no last position
+    # to clip to)
+    if len(sorted_values) == 0:
+        if len(values) > 0:
+            raise error
+        return np.zeros(0, dtype=np.intp)
+
+    positions = np.searchsorted(sorted_values, values)
+    positions = np.minimum(positions, len(sorted_values) - 1)
+    if not np.array_equal(sorted_values[positions], values):
+        raise error
+    return positions
+
+
+def build_minimums_grid(
     mixture_df: pd.DataFrame,
+    cell_ids: np.ndarray,
+    depth_bins: np.ndarray
+) -> np.ndarray:
+    """
+    Compute minimum occupancy probabilities as a dense array.
+
+    For each spatial cell, depth bin, month of year, and hour of day,
+    finds the minimum predicted occupancy probability from the complex
+    model (epsilon=1) with a single vectorized scatter.
+
+    Args:
+        mixture_df: DataFrame with columns 'cell_id', 'depth_bin', 'datetime',
+            'probability', 'epsilon'.
+        cell_ids: Array (ordered) of the cell_ids to index the grid by.
+        depth_bins: Array (ordered) of the depth_bins to index the grid by.
+
+    Returns:
+        Array of shape (len(cell_ids), len(depth_bins), 12, 24) indexed by
+        [cell, depth bin, month - 1, hour], with np.inf where there is no data.
+
+    Raises:
+        ValueError: If required columns are missing or mixture_df contains
+            cell_ids or depth_bins that are not in the given arrays.
+    """
+    # Validate input
+    required_cols = {'cell_id', 'depth_bin', 'datetime', 'probability', 'epsilon'}
+    if not required_cols.issubset(mixture_df.columns):
+        raise ValueError(f"mixture_df must have columns {required_cols}")
+
+    cell_ids = np.asarray(cell_ids)
+    depth_bins = np.asarray(depth_bins)
+    grid = np.full((len(cell_ids), len(depth_bins), 12, 24), np.inf)
+
+    # Mask to epsilon=1 (complex model only), selecting from the needed
+    # column arrays rather than filtering a copy of the whole dataframe
+    mask = mixture_df['epsilon'].to_numpy() == 1.0
+
+    if not mask.any():
+        return grid
+
+    # Drop rows without a datetime (NaT), which have no month or hour
+    datetimes = to_datetime64(mixture_df['datetime'].to_numpy()[mask])
+    valid = ~np.isnat(datetimes)
+    mask[mask] = valid
+    datetimes = datetimes[valid]
+
+    # Extract month and hour from datetime with integer arithmetic on the
+    # datetime64 values (parsing is a no-op if the column is already datetime64)
+    months = (datetimes.astype('datetime64[M]').view(np.int64) % 12 + 1).astype(np.int8)  # 1-12
+    hours = (datetimes.view(np.int64) // 3_600_000_000_000 % 24).astype(np.int8)  # 0-23
+
+    # Take the minimum per (cell_id, depth_bin, month, hour)
+    cell_codes = _positions(mixture_df['cell_id'].to_numpy()[mask], cell_ids, 'cell_ids')
+    depth_codes = _positions(
+        mixture_df['depth_bin'].to_numpy()[mask], depth_bins, 'depth_bins'
+    )
+    np.minimum.at(
+        grid,
+        (cell_codes, depth_codes, months - 1, hours),
+        mixture_df['probability'].to_numpy()[mask]
+    )
+
+    return grid
+
+
+def minimums_from_grid(
+    grid: np.ndarray,
+    cell_ids: np.ndarray,
+    depth_bins: np.ndarray,
     minimums: Dict[int, Dict[float, Dict[int, list]]] = None
+) -> Dict[int, Dict[float, Dict[int, list]]]:
+    """
+    Convert a dense minimums grid to the nested minimums dict.
+
+    Args:
+        grid: Array of shape (len(cell_ids), len(depth_bins), 12, 24) as
+            returned by build_minimums_grid.
+        cell_ids: Array of the cell_ids indexing the grid.
+        depth_bins: Array of the depth_bins indexing the grid.
+        minimums: Optional existing minimums dict to update. If None, creates new.
+
+    Returns:
+        Nested dict structure:
+        {cell_id -> {depth_bin -> {month -> [24 hourly minimums]}}}
+        with entries only for the (cell_id, depth_bin, month) combinations
+        that have data, and None for hours in those months without data.
+    """
+    if minimums is None:
+        minimums = {}
+
+    # Build nested dict structure for the (cell_id, depth_bin, month)
+    # combinations that have data, merging with any existing minimums
+    has_data = np.isfinite(grid).any(axis=3)
+    for cell_idx, depth_idx, month_idx in zip(*np.nonzero(has_data)):
+        cell_minimums = minimums.setdefault(int(cell_ids[cell_idx]), {})
+        depth_minimums = cell_minimums.setdefault(float(depth_bins[depth_idx]), {})
+
+        hourly = grid[cell_idx, depth_idx, month_idx]
+        month = int(month_idx) + 1
+        if month in depth_minimums:
+            existing = [np.inf if value is None else value for value in depth_minimums[month]]
+            hourly = np.minimum(existing, hourly)
+
+        # Hours that were never reached (still np.inf) are reported as None
+        # rather than a fabricated minimum
+        depth_minimums[month] = [
+            None if np.isinf(value) else value for value in hourly.tolist()
+        ]
+
+    return minimums
+
+
+def build_minimums(
+    mixture_df: pd.DataFrame,
+    minimums: Dict[int, Dict[float, Dict[int, list]]] = None,
+    depth_bins: Optional[np.ndarray] = None
 ) -> Dict[int, Dict[float, Dict[int, list]]]:
     """
     Compute minimum occupancy probabilities by cell, depth, month, and hour.
@@ -32,61 +215,30 @@ def build_minimums(
         mixture_df: DataFrame with columns 'cell_id', 'depth_bin', 'datetime',
             'probability', 'epsilon'.
         minimums: Optional existing minimums dict to update. If None, creates new.
+        depth_bins: Optional array (ordered) of all depth_bins in the scenario.
+            If None, the depth_bins found in mixture_df are used.
 
     Returns:
         Nested dict structure:
         {cell_id -> {depth_bin -> {month -> [24 hourly minimums]}}}
-        where month is 1-12 and the array has one minimum per hour (0-23).
+        where month is 1-12 and the array has one minimum per hour (0-23),
+        None for hours without data.
 
     Raises:
-        ValueError: If required columns are missing.
+        ValueError: If required columns are missing or mixture_df contains
+            depth_bins not in the given depth_bins.
     """
     # Validate input
     required_cols = {'cell_id', 'depth_bin', 'datetime', 'probability', 'epsilon'}
     if not required_cols.issubset(mixture_df.columns):
         raise ValueError(f"mixture_df must have columns {required_cols}")
 
-    if minimums is None:
-        minimums = {}
-
-    # Filter to epsilon=1 (complex model only)
-    filtered = mixture_df[mixture_df['epsilon'] == 1.0].copy()
-
-    if len(filtered) == 0:
-        return minimums
-
-    # Extract month and hour from datetime
-    filtered['month'] = pd.to_datetime(filtered['datetime']).dt.month  # 1-12
-    filtered['hour'] = pd.to_datetime(filtered['datetime']).dt.hour  # 0-23
-
-    # Group by cell_id, depth_bin, month, hour and find minimum
-    grouped = filtered.groupby(['cell_id', 'depth_bin', 'month', 'hour'])['probability'].min()
-
-    # Build nested dict structure
-    for (cell_id, depth_bin, month, hour), min_prob in grouped.items():
-        # Initialize nested dicts if needed
-        if cell_id not in minimums:
-            minimums[cell_id] = {}
-        if depth_bin not in minimums[cell_id]:
-            minimums[cell_id][depth_bin] = {}
-        if month not in minimums[cell_id][depth_bin]:
-            minimums[cell_id][depth_bin][month] = [np.inf] * 24
-
-        # Update minimum for this hour
-        current_min = minimums[cell_id][depth_bin][month][hour]
-        minimums[cell_id][depth_bin][month][hour] = min(current_min, min_prob)
-
-    # Convert np.inf back to a reasonable value (or keep as is for JSON serialization)
-    # Actually, let's keep track of what we've seen and fill with actual minimums
-    for cell_id in minimums:
-        for depth_bin in minimums[cell_id]:
-            for month in minimums[cell_id][depth_bin]:
-                minimums[cell_id][depth_bin][month] = [
-                    float(v) if v != np.inf else 0.0
-                    for v in minimums[cell_id][depth_bin][month]
-                ]
+    cell_ids = np.unique(mixture_df['cell_id'].to_numpy())
+    if depth_bins is None:
+        depth_bins = np.unique(mixture_df['depth_bin'].to_numpy())
+    grid = build_minimums_grid(mixture_df, cell_ids, depth_bins)
 
-    return minimums
+    return minimums_from_grid(grid, cell_ids, depth_bins, minimums)
 
 
 def build_occupancy(mixture_df: pd.DataFrame, depth_bins: np.ndarray) -> pd.DataFrame:
@@ -116,12 +268,16 @@ def build_occupancy(mixture_df: pd.DataFrame, depth_bins: np.ndarray) -> pd.Data
     if not required_cols.issubset(mixture_df.columns):
         raise ValueError(f"mixture_df must have columns {required_cols}")
 
-    # Get sorted unique values
-    unique_datetimes = sorted(mixture_df['datetime'].unique())
-    unique_epsilons = sorted(mixture_df['epsilon'].unique())
+    # Get sorted unique values along with each row's position in them (the
+    # hash-based factorize only sorts the uniques, not every row)
+    time_indices, unique_datetimes = pd.factorize(mixture_df['datetime'], sort=True)
+    model_indices, unique_epsilons = pd.factorize(mixture_df['epsilon'], sort=True)
 
     # Use provided depth_bins instead of just those in mixture_df
     # This ensures missing depth bins have null columns
+    depth_bins = np.asarray(depth_bins)
+    depth_indices = _positions(mixture_df['depth_bin'].to_numpy(), depth_bins, 'depth_bins')
+
     n_models = len(unique_epsilons)
     n_depth_bins = len(depth_bins)
     n_times = len(unique_datetimes)
@@ -132,22 +288,11 @@ def build_occupancy(mixture_df: pd.DataFrame, depth_bins: np.ndarray) -> pd.Data
     # Initialize output array with NaN for all values
     occupancy_array = np.full((n_times, n_cols), np.nan)
 
-    # Create index mappings
-    datetime_to_idx = {dt: i for i, dt in enumerate(unique_datetimes)}
-    epsilon_to_idx = {eps: i for i, eps in enumerate(unique_epsilons)}
-    depth_bin_to_idx = {db: i for i, db in enumerate(depth_bins)}
-
-    # Vectorized filling using advanced indexing
-    # Create arrays of indices for each row in mixture_df
-    time_indices = mixture_df['datetime'].map(datetime_to_idx).values
-    model_indices = mixture_df['epsilon'].map(epsilon_to_idx).values
-    depth_indices = mixture_df['depth_bin'].map(depth_bin_to_idx).values
-
     # Calculate column indices: model_idx * n_depth_bins + depth_idx
     col_indices = model_indices * n_depth_bins + depth_indices
 
     # Fill array using vectorized indexing
-    occupancy_array[time_indices, col_indices] = mixture_df['probability'].values
+    occupancy_array[time_indices, col_indices] = mixture_df['probability'].to_numpy()
 
     # Create dataframe
     occupancy_df = pd.DataFrame(
@@ -176,12 +321,66 @@ def build_cell_depths(context_df: pd.DataFrame) -> Dict[int, float]:
     if not required_cols.issubset(context_df.columns):
         raise ValueError(f"context_df must have columns {required_cols}")
 
-    # Group by cell_id and get max depth_bin
-    cell_depths = context_df.groupby('cell_id')['depth_bin'].max().to_dict()
+    if len(context_df) == 0:
+        return {}
+
+    # Number the cell_ids (in sorted order, any hashable id works), dropping
+    # rows without a cell_id as groupby would
+    codes, cell_ids = pd.factorize(context_df['cell_id'], sort=True)
+    rows = np.flatnonzero(codes >= 0)
+
+    if len(rows) == 0:
+        return {}
+
+    # Sort by cell number once and take the max depth_bin over each
+    # contiguous run of a cell in a single reduceat pass (fmax skips NaN
+    # depth_bins like groupby().max(), a cell with only NaN gets NaN)
+    order = rows[np.argsort(codes[rows], kind='stable')]
+    sorted_codes = codes[order]
+    depth_bins = context_df['depth_bin'].to_numpy()[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1]
+    max_depths = np.fmax.reduceat(depth_bins, starts)
+
+    cell_depths = dict(zip(cell_ids[sorted_codes[starts]].tolist(), max_depths.tolist()))
 
     return cell_depths
 
 
+def build_cell(
+    cell_id: int,
+    cell_mixture: pd.DataFrame,
+    depth_bins: np.ndarray,
+    output_dir: str
+) -> np.ndarray:
+    """
+    Build the outputs for a single cell.
+
+    Writes the cell's occupancy parquet file and computes its minimums. Cells
+    are independent of one another so this can run in a worker process.
+
+    Args:
+        cell_id: The cell being built.
+        cell_mixture: Mixtures for this cell only, with columns 'depth_bin',
+            'datetime', 'probability', 'epsilon', 'cell_id'.
+        depth_bins: Array (ordered) of all depth_bins in the scenario.
+        output_dir: Scenario directory to write {cell_id}_occupancy.parquet to.
+
+    Returns:
+        Minimums for this cell, an array of shape (len(depth_bins), 12, 24)
+        (see build_minimums_grid).
+    """
+    # Build occupancy dataframe
+    occupancy_df = build_occupancy(cell_mixture, depth_bins)
+
+    # Save as compressed parquet
+    occupancy_file = os.path.join(output_dir, f'{cell_id}_occupancy.parquet')
+    occupancy_df.to_parquet(
+        occupancy_file, engine='pyarrow', compression='zstd', compression_level=3
+    )
+
+    return build_minimums_grid(cell_mixture, np.array([cell_id]), depth_bins)[0]
+
+
 def build_report(
     meta_data: Dict[str, Any],
     model_df: pd.DataFrame,
@@ -191,7 +390,9 @@ def build_report(
     reference_model_actuals_df: pd.DataFrame,
     selections_actuals_df: pd.DataFrame,
     epsilons: np.ndarray,
-    data_dir: str
+    data_dir: str,
+    max_workers: int = 1,
+    support_cache_dir: Optional[str] = None
 ) -> None:
     """
     Build complete depth occupancy report.
@@ -210,10 +411,21 @@ def build_report(
         selections_actuals_df: Actual observed choices with '_decision', '_choice'.
         epsilons: Array of epsilon values for model mixture (0 to 1).
         data_dir: Directory where scenario subdirectory will be created.
+        max_workers: Number of processes used to build cells in parallel.
+            Defaults to 1, which builds cells in this process. Workers are
+            spawned and re-import the calling script, so with max_workers > 1
+            a script must call build_report under an
+            `if __name__ == "__main__":` guard.
+        support_cache_dir: Optional directory to cache the computed support
+            in, so reruns on the same actuals skip recomputing it (see
+            compute_support).
 
     Raises:
         ValueError: If inputs are invalid or metadata is incomplete.
     """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
     # Validate required metadata fields
     required_meta_fields = {
         'scenario_id', 'name', 'species', 'model', 'reference_model',
@@ -235,6 +447,15 @@ def build_report(
     if model_act_keys != ref_act_keys:
         raise ValueError("model_actuals_df and reference_model_actuals_df must have same pairs")
 
+    # Cast the join keys to shared categoricals (on copies) and parse
+    # datetimes once, so every merge and groupby below works on integer codes
+    # and the datetime64 column carries through to the mixtures and cells
+    for key in ('_decision', '_choice'):
+        model_df, reference_model_df, context_df = _as_shared_categories(
+            [model_df, reference_model_df, context_df], key
+        )
+    context_df['datetime'] = pd.to_datetime(context_df['datetime'])
+
     # Get scenario_id
     scenario_id = meta_data['scenario_id']
 
@@ -252,7 +473,8 @@ def build_report(
         model_actuals_df,
         reference_model_actuals_df,
         selections_actuals_df,
-        epsilons
+        epsilons,
+        cache_dir=support_cache_dir
     )
 
     # Build spatial geometries
@@ -260,17 +482,15 @@ def build_report(
     geojson, cell_id_df = build_geojson_h3(context_df)
 
     # Save geometries
-    with open(os.path.join(output_dir, 'geometries.geojson'), 'w') as f:
-        json.dump(geojson, f)
+    _write_json(os.path.join(output_dir, 'geometries.geojson'), geojson)
 
     # Build timeline
     print("Building timeline...")
     timeline = build_timeline(context_df)
 
     # Save timeline (convert to ISO format strings)
-    timeline_strings = [pd.Timestamp(dt).isoformat() for dt in timeline]
-    with open(os.path.join(output_dir, 'timestamps.json'), 'w') as f:
-        json.dump(timeline_strings, f)
+    timeline_strings = np.datetime_as_string(timeline, unit='s').tolist()
+    _write_json(os.path.join(output_dir, 'timestamps.json'), timeline_strings)
 
     # Merge context with cell_ids
     context_with_cells = context_df.merge(cell_id_df, on=['_decision', '_choice'])
@@ -280,11 +500,10 @@ def build_report(
     cell_depths = build_cell_depths(context_with_cells)
 
     # Save cell depths
-    with open(os.path.join(output_dir, 'cell_depths.json'), 'w') as f:
-        json.dump(cell_depths, f)
+    _write_json(os.path.join(output_dir, 'cell_depths.json'), cell_depths)
 
-    # Get depth bins from context
-    depth_bins = sorted(context_df['depth_bin'].unique())
+    # Get depth bins from context (np.unique returns them sorted)
+    depth_bins = np.unique(context_df['depth_bin'].to_numpy())
 
     # Derive metadata from data
     print("Computing derived metadata...")
@@ -293,11 +512,10 @@ def build_report(
     first_h3 = context_df['h3_index'].iloc[0]
     resolution = h3.get_resolution(first_h3)
 
-    # Get time window
-    all_datetimes = pd.to_datetime(context_df['datetime'])
+    # Get time window (datetimes were parsed up front)
     time_window = [
-        all_datetimes.min().isoformat(),
-        all_datetimes.max().isoformat()
+        context_df['datetime'].min().isoformat(),
+        context_df['datetime'].max().isoformat()
     ]
 
     # Get grid size
@@ -314,54 +532,74 @@ def build_report(
     })
 
     # Save metadata
-    with open(os.path.join(output_dir, 'meta_data.json'), 'w') as f:
-        json.dump(meta_data_complete, f, indent=2)
+    _write_json(os.path.join(output_dir, 'meta_data.json'), meta_data_complete, indent=True)
 
     # Build mixtures and occupancy files per cell
     print("Building mixtures and occupancy files...")
 
-    # Merge model data with context to get depth_bin, datetime, h3_index
+    # Merge model data with context to get depth_bin, datetime, h3_index. Only
+    # the model side needs the context: compute_mixtures joins just the
+    # reference probabilities onto it by (_decision, _choice)
     model_with_context = model_df.merge(
         context_df[['_decision', '_choice', 'datetime', 'h3_index', 'depth_bin']],
         on=['_decision', '_choice']
     )
 
-    reference_with_context = reference_model_df.merge(
-        context_df[['_decision', '_choice', 'datetime', 'h3_index', 'depth_bin']],
-        on=['_decision', '_choice']
-    )
-
     # Compute mixtures
     print("Computing model mixtures...")
-    mixtures_df = compute_mixtures(model_with_context, reference_with_context, epsilons)
-
-    # Add cell_id to mixtures
-    mixtures_with_cells = mixtures_df.merge(cell_id_df, on=['_decision', '_choice'])
+    mixtures_df = compute_mixtures(model_with_context, reference_model_df, epsilons)
 
-    # Initialize minimums dict
-    minimums = {}
-
-    # Get unique cell_ids
-    unique_cells = sorted(mixtures_with_cells['cell_id'].unique())
-
-    print(f"Processing {len(unique_cells)} cells...")
-
-    for cell_id in unique_cells:
-        # Filter to this cell
-        cell_mixture = mixtures_with_cells[mixtures_with_cells['cell_id'] == cell_id].copy()
-
-        # Build occupancy dataframe
-        occupancy_df = build_occupancy(cell_mixture, depth_bins)
-
-        # Save as compressed parquet
-        occupancy_file = os.path.join(output_dir, f'{cell_id}_occupancy.parquet.gz')
-        occupancy_df.to_parquet(occupancy_file, compression='gzip')
-
-        # Update minimums
-        minimums = build_minimums(cell_mixture, minimums)
+    # Add cell_id to mixtures, keeping only the columns build_cell reads (the
+    # categorical keys carry every decision in the report and h3_index is
+    # already in the cell_id, so neither should be pickled to the workers)
+    mixtures_with_cells = mixtures_df.merge(cell_id_df, on=['_decision', '_choice'])[
+        ['cell_id', 'depth_bin', 'datetime', 'epsilon', 'probability']
+    ]
 
-        if (cell_id + 1) % 10 == 0:
-            print(f"  Processed {cell_id + 1}/{len(unique_cells)} cells")
+    # Accumulate minimums in a dense (cell_id, depth_bin, month, hour) array
+    # and only convert to the nested dict once all cells are built
+    cell_ids = np.arange(grid_size)
+    minimums_grid = np.full((grid_size, len(depth_bins), 12, 24), np.inf)
+
+    # Split into cells with a single groupby pass (ordered by cell_id)
+    cell_groups = mixtures_with_cells.groupby('cell_id', sort=True)
+    n_cells = cell_groups.ngroups
+    print(f"Processing {n_cells} cells with {max_workers} worker(s)...")
+
+    if max_workers == 1:
+        for n_processed, (cell_id, cell_mixture) in enumerate(cell_groups, start=1):
+            minimums_grid[cell_id] = build_cell(cell_id, cell_mixture, depth_bins, output_dir)
+
+            if n_processed % 10 == 0:
+                print(f"  Processed {n_processed}/{n_cells} cells")
+    else:
+        n_processed = 0
+        # Spawn the workers rather than relying on the platform default, which
+        # may fork the whole (large) parent process
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            pending = {}
+            for cell_id, cell_mixture in cell_groups:
+                # Bound the cells in flight so only a few cells' mixtures are
+                # held (and sent to workers) at any one time
+                if len(pending) >= 2 * max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        minimums_grid[pending.pop(future)] = future.result()
+                        n_processed += 1
+                        if n_processed % 10 == 0:
+                            print(f"  Processed {n_processed}/{n_cells} cells")
+
+                future = executor.submit(
+                    build_cell, cell_id, cell_mixture, depth_bins, output_dir
+                )
+                pending[future] = cell_id
+
+            for future, cell_id in pending.items():
+                minimums_grid[cell_id] = future.result()
+
+    minimums = minimums_from_grid(minimums_grid, cell_ids, depth_bins)
 
     # Save minimums
     print("Saving minimums...")
@@ -377,7 +615,6 @@ def build_report(
         for cell_id, depth_dict in minimums.items()
     }
 
-    with open(os.path.join(output_dir, 'minimums.json'), 'w') as f:
-        json.dump(minimums_serializable, f)
+    _write_json(os.path.join(output_dir, 'minimums.json'), minimums_serializable)
 
     print(f"Report complete! Saved to {output_dir}")
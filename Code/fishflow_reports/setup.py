@@ -12,6 +12,7 @@ setup(
         "h3>=4.0.0",
         "pyarrow>=6.0.0",
         "geojson>=2.5.0",
+        "orjson>=3.9.0",
     ],
     python_requires=">=3.9",
     author="FishFlow Team",
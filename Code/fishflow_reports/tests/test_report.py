@@ -10,6 +10,7 @@ import pytest
 
 from fishflow.depth.report import (
     build_minimums,
+    build_minimums_grid,
     build_occupancy,
     build_cell_depths,
     build_report
@@ -39,13 +40,17 @@ class TestBuildMinimums:
         # Check structure
         assert 0 in minimums
         assert 10.0 in minimums[0]
-        assert 0 in minimums[0][10.0]  # January (month 0)
-        assert 1 in minimums[0][10.0]  # February (month 1)
+        assert 1 in minimums[0][10.0]  # January (month 1)
+        assert 2 in minimums[0][10.0]  # February (month 2)
 
         # Check values
-        assert minimums[0][10.0][0][8] == 0.5  # Jan, hour 8
-        assert minimums[0][10.0][0][9] == 0.3  # Jan, hour 9
-        assert minimums[0][10.0][1][8] == 0.4  # Feb, hour 8 (min of 0.6 and 0.4)
+        assert minimums[0][10.0][1][8] == 0.5  # Jan, hour 8
+        assert minimums[0][10.0][1][9] == 0.3  # Jan, hour 9
+        assert minimums[0][10.0][2][8] == 0.4  # Feb, hour 8 (min of 0.6 and 0.4)
+
+        # Hours and months without data are not fabricated
+        assert minimums[0][10.0][1][0] is None
+        assert 3 not in minimums[0][10.0]
 
     def test_epsilon_filtering(self):
         """Test that only epsilon=1 is used."""
@@ -60,19 +65,19 @@ class TestBuildMinimums:
         minimums = build_minimums(mixture_df)
 
         # Should only use epsilon=1 (probability=0.5)
-        assert minimums[0][10.0][0][8] == 0.5
+        assert minimums[0][10.0][1][8] == 0.5
 
     def test_update_existing_minimums(self):
         """Test updating existing minimums dict."""
         existing = {
             0: {
                 10.0: {
-                    0: [1.0] * 24
+                    1: [1.0] * 24
                 }
             }
         }
 
-        existing[0][10.0][0][8] = 0.6
+        existing[0][10.0][1][8] = 0.6
 
         mixture_df = pd.DataFrame({
             'cell_id': [0],
@@ -85,7 +90,96 @@ class TestBuildMinimums:
         minimums = build_minimums(mixture_df, existing)
 
         # Should update to new minimum
-        assert minimums[0][10.0][0][8] == 0.4
+        assert minimums[0][10.0][1][8] == 0.4
+        # Hours without new data keep their existing minimum
+        assert minimums[0][10.0][1][9] == 1.0
+
+    def test_known_depth_bins(self):
+        """Test passing the scenario depth_bins."""
+        mixture_df = pd.DataFrame({
+            'cell_id': [0, 0],
+            'depth_bin': [20.0, 10.0],
+            'datetime': ['2023-01-15 08:00:00', '2023-01-15 08:00:00'],
+            'probability': [0.4, 0.6],
+            'epsilon': [1.0, 1.0]
+        })
+
+        minimums = build_minimums(mixture_df, depth_bins=np.array([10.0, 20.0, 30.0]))
+
+        assert minimums[0][10.0][1][8] == 0.6
+        assert minimums[0][20.0][1][8] == 0.4
+        # Depth bins without data are omitted
+        assert 30.0 not in minimums[0]
+
+        with pytest.raises(ValueError):
+            build_minimums(mixture_df, depth_bins=np.array([10.0]))
+
+    def test_update_existing_unreached_hours(self):
+        """Test that existing hours without data are filled by new data."""
+        existing = {0: {10.0: {1: [None] * 24}}}
+
+        mixture_df = pd.DataFrame({
+            'cell_id': [0],
+            'depth_bin': [10.0],
+            'datetime': ['2023-01-15 08:00:00'],
+            'probability': [0.4],
+            'epsilon': [1.0]
+        })
+
+        minimums = build_minimums(mixture_df, existing)
+
+        assert minimums[0][10.0][1][8] == 0.4
+        assert minimums[0][10.0][1][9] is None
+
+
+class TestBuildMinimumsGrid:
+    """Tests for build_minimums_grid function."""
+
+    def test_grid(self):
+        """Test the dense grid layout and missing entries."""
+        mixture_df = pd.DataFrame({
+            'cell_id': [2, 2, 2],
+            'depth_bin': [20.0, 20.0, 20.0],
+            'datetime': ['2023-03-15 05:00:00', '2023-03-16 05:00:00', '2023-03-16 05:00:00'],
+            'probability': [0.7, 0.2, 0.1],
+            'epsilon': [1.0, 1.0, 0.5]
+        })
+
+        grid = build_minimums_grid(mixture_df, np.array([1, 2]), np.array([10.0, 20.0]))
+
+        assert grid.shape == (2, 2, 12, 24)
+        # Indexed by [cell, depth bin, month - 1, hour], epsilon=1 only
+        assert grid[1, 1, 2, 5] == 0.2
+        # Everything else has no data
+        assert np.isinf(grid).sum() == grid.size - 1
+
+    def test_missing_datetime(self):
+        """Test that rows without a datetime (NaT) are dropped."""
+        mixture_df = pd.DataFrame({
+            'cell_id': [0, 0],
+            'depth_bin': [10.0, 10.0],
+            'datetime': pd.to_datetime(['2023-03-15 05:00:00', None]),
+            'probability': [0.7, 0.1],
+            'epsilon': [1.0, 1.0]
+        })
+
+        grid = build_minimums_grid(mixture_df, np.array([0]), np.array([10.0]))
+
+        assert grid[0, 0, 2, 5] == 0.7
+        assert np.isinf(grid).sum() == grid.size - 1
+
+    def test_unknown_depth_bin(self):
+        """Test that depth bins outside depth_bins raise ValueError."""
+        mixture_df = pd.DataFrame({
+            'cell_id': [0],
+            'depth_bin': [30.0],
+            'datetime': ['2023-01-15 08:00:00'],
+            'probability': [0.4],
+            'epsilon': [1.0]
+        })
+
+        with pytest.raises(ValueError):
+            build_minimums_grid(mixture_df, np.array([0]), np.array([10.0, 20.0]))
 
 
 class TestBuildOccupancy:
@@ -149,6 +243,19 @@ class TestBuildOccupancy:
         with pytest.raises(ValueError, match="must have columns"):
             build_occupancy(bad_df, depth_bins)
 
+    @pytest.mark.parametrize("depth_bins", [np.array([20.0]), np.array([])])
+    def test_unknown_depth_bin(self, depth_bins):
+        """Test that depth bins outside depth_bins raise ValueError."""
+        mixture_df = pd.DataFrame({
+            'depth_bin': [10.0],
+            'datetime': ['2023-01-01'],
+            'probability': [0.3],
+            'epsilon': [1.0]
+        })
+
+        with pytest.raises(ValueError, match="not found in depth_bins"):
+            build_occupancy(mixture_df, depth_bins)
+
     def test_missing_depth_bins(self):
         """Test that missing depth bins result in null columns."""
         mixture_df = pd.DataFrame({
@@ -203,6 +310,39 @@ class TestBuildCellDepths:
         assert len(cell_depths) == 1
         assert cell_depths[0] == 15.0
 
+    def test_unsorted_cells(self):
+        """Test with rows of each cell interleaved."""
+        context_df = pd.DataFrame({
+            'cell_id': [3, 1, 3, 1, 2],
+            'depth_bin': [10.0, 40.0, 50.0, 20.0, 5.0]
+        })
+
+        cell_depths = build_cell_depths(context_df)
+
+        assert cell_depths == {1: 40.0, 2: 5.0, 3: 50.0}
+
+    def test_nan_depth_bin(self):
+        """Test that NaN depth bins are skipped."""
+        context_df = pd.DataFrame({
+            'cell_id': [1, 1, 2],
+            'depth_bin': [np.nan, 20.0, 5.0]
+        })
+
+        cell_depths = build_cell_depths(context_df)
+
+        assert cell_depths == {1: 20.0, 2: 5.0}
+
+    def test_string_cell_ids(self):
+        """Test with non-numeric cell ids."""
+        context_df = pd.DataFrame({
+            'cell_id': ['b', 'a', 'b'],
+            'depth_bin': [10.0, 40.0, 50.0]
+        })
+
+        cell_depths = build_cell_depths(context_df)
+
+        assert cell_depths == {'a': 40.0, 'b': 50.0}
+
     def test_missing_columns(self):
         """Test error on missing columns."""
         bad_df = pd.DataFrame({'cell_id': [0]})
@@ -219,45 +359,29 @@ class TestBuildReport:
         # Use valid H3 indices
         h3_indices = ['85283473fffffff', '8528347bfffffff']
 
-        # Create context
-        decisions = []
-        choices = []
-        datetimes = []
-        h3_idx_list = []
-        depth_bins = []
-
-        for i, dt in enumerate(['2023-01-01 00:00:00', '2023-01-01 12:00:00']):
-            for h3_idx in h3_indices:
-                for depth in [10.0, 20.0]:
-                    decisions.append(i * 10 + len(decisions))
-                    choices.append('A')
-                    datetimes.append(dt)
-                    h3_idx_list.append(h3_idx)
-                    depth_bins.append(depth)
+        # Create context, one decision per (datetime, h3_index, depth_bin)
+        datetimes = np.array(['2023-01-01 00:00:00', '2023-01-01 12:00:00'])
+        h3_indices = np.array(h3_indices)
+        depths = np.array([10.0, 20.0])
+        n_rows = len(datetimes) * len(h3_indices) * len(depths)
 
         context_df = pd.DataFrame({
-            '_decision': decisions,
-            '_choice': choices,
-            'datetime': datetimes,
-            'h3_index': h3_idx_list,
-            'depth_bin': depth_bins
+            '_decision': np.arange(n_rows),
+            '_choice': 'A',
+            'datetime': np.repeat(datetimes, len(h3_indices) * len(depths)),
+            'h3_index': np.tile(np.repeat(h3_indices, len(depths)), len(datetimes)),
+            'depth_bin': np.tile(depths, len(datetimes) * len(h3_indices))
         })
 
         # Create model predictions
         model_df = context_df[['_decision', '_choice']].copy()
         model_df['probability'] = np.random.dirichlet([1, 1], len(model_df))[:, 0]
         # Normalize by decision
-        for dec in model_df['_decision'].unique():
-            mask = model_df['_decision'] == dec
-            total = model_df.loc[mask, 'probability'].sum()
-            model_df.loc[mask, 'probability'] /= total
+        model_df['probability'] /= model_df.groupby('_decision')['probability'].transform('sum')
 
         # Create reference model (uniform)
         reference_df = model_df.copy()
-        for dec in reference_df['_decision'].unique():
-            mask = reference_df['_decision'] == dec
-            n_choices = mask.sum()
-            reference_df.loc[mask, 'probability'] = 1.0 / n_choices
+        reference_df['probability'] = 1.0 / reference_df.groupby('_decision')['_choice'].transform('size')
 
         # Create actuals (smaller set)
         n_actuals = 4
@@ -290,8 +414,9 @@ class TestBuildReport:
             selections_actuals
         )
 
-    def test_full_report_generation(self):
-        """Test complete report generation."""
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_full_report_generation(self, max_workers):
+        """Test complete report generation (in process and in parallel)."""
         (
             context_df,
             model_df,
@@ -328,7 +453,8 @@ class TestBuildReport:
                 reference_actuals,
                 selections_actuals,
                 epsilons,
-                tmpdir
+                tmpdir,
+                max_workers=max_workers
             )
 
             # Check that output directory exists
@@ -353,9 +479,14 @@ class TestBuildReport:
             assert 'time_window' in saved_meta
 
             # Check that occupancy files exist
-            occupancy_files = [f for f in os.listdir(output_dir) if f.endswith('_occupancy.parquet.gz')]
+            occupancy_files = [f for f in os.listdir(output_dir) if f.endswith('_occupancy.parquet')]
             assert len(occupancy_files) > 0
 
+            # Every cell's minimums are collected
+            with open(os.path.join(output_dir, 'minimums.json')) as f:
+                saved_minimums = json.load(f)
+            assert sorted(saved_minimums) == sorted(f.split('_')[0] for f in occupancy_files)
+
     def test_missing_metadata(self):
         """Test error on missing required metadata."""
         (
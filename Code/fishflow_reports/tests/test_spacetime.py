@@ -5,7 +5,7 @@ import pandas as pd
 import pytest
 import h3
 
-from fishflow.common.spacetime import build_geojson_h3, build_timeline
+from fishflow.common.spacetime import build_geojson_h3, build_timeline, to_datetime64
 
 
 class TestBuildGeojsonH3:
@@ -98,6 +98,27 @@ class TestBuildGeojsonH3:
         # All rows should have same cell_id
         assert cell_id_df['cell_id'].nunique() == 1
 
+    def test_mixed_polygon_sizes(self):
+        """Test that pentagons and hexagons are both closed lon/lat rings."""
+        pentagon = h3.get_pentagons(5)[0]
+        hexagon = '85283473fffffff'
+
+        context_df = pd.DataFrame({
+            '_decision': [1, 2],
+            '_choice': ['A', 'B'],
+            'h3_index': [pentagon, hexagon]
+        })
+
+        geojson, _ = build_geojson_h3(context_df)
+
+        for feature in geojson['features']:
+            h3_index = sorted([pentagon, hexagon])[feature['properties']['cell_id']]
+            boundary = h3.cell_to_boundary(h3_index)
+            ring = feature['geometry']['coordinates'][0]
+            assert len(ring) == len(boundary) + 1
+            assert ring[0] == ring[-1]
+            assert ring[0] == [boundary[0][1], boundary[0][0]]
+
 
 class TestBuildTimeline:
     """Tests for build_timeline function."""
@@ -144,8 +165,8 @@ class TestBuildTimeline:
 
         timeline = build_timeline(context_df)
 
-        expected_order = ['2023-01-01', '2023-02-01', '2023-03-01']
-        assert list(timeline) == expected_order
+        expected_order = pd.to_datetime(['2023-01-01', '2023-02-01', '2023-03-01'])
+        assert list(timeline) == list(expected_order.to_numpy())
 
     def test_missing_columns(self):
         """Test error on missing required columns."""
@@ -169,4 +190,38 @@ class TestBuildTimeline:
         timeline = build_timeline(context_df)
 
         assert len(timeline) == 1
-        assert timeline[0] == '2023-01-01'
+        assert timeline[0] == np.datetime64('2023-01-01')
+
+    def test_timeline_dtype(self):
+        """Test that the timeline is returned as datetime64."""
+        context_df = pd.DataFrame({
+            '_decision': [1, 2],
+            '_choice': ['A', 'B'],
+            'datetime': ['2023-01-02 06:00:00', '2023-01-01 18:00:00']
+        })
+
+        timeline = build_timeline(context_df)
+
+        assert timeline.dtype == np.dtype('datetime64[ns]')
+        assert pd.Timestamp(timeline[0]).isoformat() == '2023-01-01T18:00:00'
+
+
+class TestToDatetime64:
+    """Tests for to_datetime64 function."""
+
+    def test_strings(self):
+        """Test parsing datetime strings."""
+        datetimes = to_datetime64(pd.Series(['2023-01-01 05:00:00', '2023-06-30 00:00:00']))
+
+        assert datetimes.dtype == np.dtype('datetime64[ns]')
+        assert datetimes[0] == np.datetime64('2023-01-01T05:00:00')
+        assert datetimes[1] == np.datetime64('2023-06-30')
+
+    def test_already_parsed(self):
+        """Test that datetime64 values pass through unchanged."""
+        values = pd.Series(pd.to_datetime(['2023-01-01 05:00:00']))
+
+        datetimes = to_datetime64(values)
+
+        assert datetimes.dtype == np.dtype('datetime64[ns]')
+        assert np.array_equal(datetimes, values.to_numpy())
@@ -27,10 +27,7 @@ class TestLogLikelihoodMember:
             [0.8, 0.2],
             [0.3, 0.7]
         ])
-        selections = np.array([
-            [1, 0],
-            [0, 1]
-        ])
+        selections = np.array([0, 1])
 
         # At epsilon=1, should use model only
         ll = log_likelihood_member(1.0, reference_model, model, selections)
@@ -46,7 +43,7 @@ class TestLogLikelihoodMember:
         """Test epsilon bounds validation."""
         ref = np.array([[0.5, 0.5]])
         model = np.array([[0.8, 0.2]])
-        sel = np.array([[1, 0]])
+        sel = np.array([0])
 
         with pytest.raises(ValueError, match="epsilon must be between 0 and 1"):
             log_likelihood_member(-0.1, ref, model, sel)
@@ -58,11 +55,22 @@ class TestLogLikelihoodMember:
         """Test shape compatibility validation."""
         ref = np.array([[0.5, 0.5]])
         model = np.array([[0.8, 0.2, 0.0]])  # Wrong shape
-        sel = np.array([[1, 0]])
+        sel = np.array([0])
 
         with pytest.raises(ValueError, match="same shape"):
             log_likelihood_member(0.5, ref, model, sel)
 
+    def test_selection_validation(self):
+        """Test selection index validation."""
+        ref = np.array([[0.5, 0.5]])
+        model = np.array([[0.8, 0.2]])
+
+        with pytest.raises(ValueError, match="one entry per decision"):
+            log_likelihood_member(0.5, ref, model, np.array([0, 1]))
+
+        with pytest.raises(ValueError, match="index a choice"):
+            log_likelihood_member(0.5, ref, model, np.array([2]))
+
 
 class TestProbMembers:
     """Tests for prob_members function."""
@@ -71,7 +79,7 @@ class TestProbMembers:
         """Test with uniform prior."""
         reference_model = np.array([[0.5, 0.5]])
         model = np.array([[0.9, 0.1]])
-        selections = np.array([[1, 0]])
+        selections = np.array([0])
         epsilons = np.array([0.0, 0.5, 1.0])
 
         posteriors = prob_members(
@@ -89,7 +97,7 @@ class TestProbMembers:
         """Test with custom prior."""
         reference_model = np.array([[0.5, 0.5]])
         model = np.array([[0.9, 0.1]])
-        selections = np.array([[1, 0]])
+        selections = np.array([0])
         epsilons = np.array([0.0, 1.0])
         prior = np.array([0.9, 0.1])  # Strong prior for reference model
 
@@ -103,12 +111,31 @@ class TestProbMembers:
         """Test that epsilons must be sorted."""
         ref = np.array([[0.5, 0.5]])
         model = np.array([[0.9, 0.1]])
-        sel = np.array([[1, 0]])
+        sel = np.array([0])
         epsilons = np.array([1.0, 0.0, 0.5])  # Not sorted
 
         with pytest.raises(ValueError, match="sorted"):
             prob_members(ref, model, sel, epsilons)
 
+    def test_matches_log_likelihood_member(self):
+        """Test that posteriors agree with per-epsilon log likelihoods."""
+        rng = np.random.default_rng(0)
+        reference_model = rng.random((20, 4))
+        model = rng.random((20, 4))
+        selections = rng.integers(0, 4, 20)
+        epsilons = np.linspace(0, 1, 11)
+
+        posteriors = prob_members(reference_model, model, selections, epsilons)
+
+        log_likelihoods = np.array([
+            log_likelihood_member(eps, reference_model, model, selections)
+            for eps in epsilons
+        ])
+        expected = np.exp(log_likelihoods - log_likelihoods.max())
+        expected = expected / expected.sum()
+
+        assert np.allclose(posteriors, expected)
+
 
 class TestBuildModelMatrices:
     """Tests for build_model_matrices function."""
@@ -138,13 +165,35 @@ class TestBuildModelMatrices:
 
         assert model_mat.shape == (2, 2)
         assert ref_mat.shape == (2, 2)
-        assert sel_mat.shape == (2, 2)
+        assert sel_mat.shape == (2,)
+        assert model_mat.dtype == ref_mat.dtype == np.float32
+        assert model_mat.flags['C_CONTIGUOUS']
+        assert sel_mat.dtype == np.int32
 
-        # Check selection matrix
-        assert sel_mat[0, 0] == 1  # Decision 1, choice A
-        assert sel_mat[0, 1] == 0
-        assert sel_mat[1, 0] == 0
-        assert sel_mat[1, 1] == 1  # Decision 2, choice B
+        # Check selected choice per decision
+        assert sel_mat[0] == 0  # Decision 1, choice A
+        assert sel_mat[1] == 1  # Decision 2, choice B
+
+    def test_tiny_probabilities(self):
+        """Test that tiny but valid probabilities don't flush to zero."""
+        model_df = pd.DataFrame({
+            '_decision': [1, 1],
+            '_choice': ['A', 'B'],
+            'probability': [1e-50, 1.0]
+        })
+        reference_df = model_df.assign(probability=[1e-50, 1.0])
+        selections_df = pd.DataFrame({'_decision': [1], '_choice': ['A']})
+
+        model_mat, ref_mat, sel_mat = build_model_matrices(
+            model_df, reference_df, selections_df
+        )
+        assert model_mat[0, 0] == ref_mat[0, 0] == np.finfo(np.float32).tiny
+
+        support = compute_support(
+            model_df, reference_df, selections_df, np.linspace(0, 1, 3)
+        )
+        assert np.all(np.isfinite(support))
+        assert np.isclose(support.sum(), 1.0)
 
     def test_missing_columns(self):
         """Test error on missing columns."""
@@ -209,6 +258,66 @@ class TestComputeSupport:
         assert np.isclose(support.sum(), 1.0)
         assert np.all(support >= 0)
 
+    def test_cache(self, tmp_path):
+        """Test that support is cached per distinct set of inputs."""
+        model_df = pd.DataFrame({
+            '_decision': [1, 1],
+            '_choice': ['A', 'B'],
+            'probability': [0.9, 0.1]
+        })
+        reference_df = model_df.assign(probability=0.5)
+        selections_df = pd.DataFrame({'_decision': [1], '_choice': ['A']})
+        epsilons = np.linspace(0, 1, 3)
+
+        support = compute_support(
+            model_df, reference_df, selections_df, epsilons, cache_dir=str(tmp_path)
+        )
+        cache_files = list(tmp_path.iterdir())
+        assert len(cache_files) == 1
+        assert np.array_equal(np.load(cache_files[0]), support)
+
+        # Identical inputs are served from the cache
+        np.save(cache_files[0], np.zeros(3))
+        cached = compute_support(
+            model_df, reference_df, selections_df, epsilons, cache_dir=str(tmp_path)
+        )
+        assert np.array_equal(cached, np.zeros(3))
+
+        # Different inputs are computed and cached separately
+        compute_support(
+            model_df.assign(probability=[0.8, 0.2]), reference_df, selections_df,
+            epsilons, cache_dir=str(tmp_path)
+        )
+        assert len(list(tmp_path.iterdir())) == 2
+
+    @pytest.mark.parametrize("contents", [b"\x93NUMPY\x01", None])
+    def test_damaged_cache(self, tmp_path, contents):
+        """Test that truncated or wrongly shaped cache files are recomputed."""
+        model_df = pd.DataFrame({
+            '_decision': [1, 1],
+            '_choice': ['A', 'B'],
+            'probability': [0.9, 0.1]
+        })
+        reference_df = model_df.assign(probability=0.5)
+        selections_df = pd.DataFrame({'_decision': [1], '_choice': ['A']})
+        epsilons = np.linspace(0, 1, 3)
+
+        support = compute_support(
+            model_df, reference_df, selections_df, epsilons, cache_dir=str(tmp_path)
+        )
+        cache_file, = tmp_path.iterdir()
+        if contents is None:
+            np.save(cache_file, np.zeros(2))
+        else:
+            cache_file.write_bytes(contents)
+
+        recomputed = compute_support(
+            model_df, reference_df, selections_df, epsilons, cache_dir=str(tmp_path)
+        )
+        assert np.array_equal(recomputed, support)
+        assert np.array_equal(np.load(cache_file), support)
+        assert list(tmp_path.iterdir()) == [cache_file]
+
 
 class TestComputeMixtures:
     """Tests for compute_mixtures function."""